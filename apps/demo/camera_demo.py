@@ -1,10 +1,32 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pygame
-import pygame.locals
+from pygame.locals import (
+    K_1,
+    K_2,
+    K_3,
+    K_4,
+    K_5,
+    K_DOWN,
+    K_EQUALS,
+    K_ESCAPE,
+    K_LEFT,
+    K_MINUS,
+    K_RIGHT,
+    K_UP,
+    KEYDOWN,
+    QUIT,
+    VIDEORESIZE,
+    K_a,
+    K_d,
+    K_s,
+    K_w,
+)
 from pygame.math import Vector2
 from pygame.sprite import Sprite
 from pytmx.util_pygame import load_pygame  # type: ignore
@@ -22,8 +44,12 @@ from pyscroll.group import PyscrollGroup
 from pyscroll.orthographic import BufferedRenderer
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pygame.surface import Surface
 
+    from pyscroll.common import Vector2D
+
 CURRENT_DIR = Path(__file__).parent
 RESOURCES_DIR = CURRENT_DIR
 WINDOW_SIZE = (800, 600)
@@ -32,6 +58,7 @@ ZOOM_STEP = 0.25
 INITIAL_ZOOM = 2.0
 
 
+@lru_cache(maxsize=64)
 def load_image(filename: str) -> Surface:
     path = RESOURCES_DIR / filename
     return pygame.image.load(str(path)).convert_alpha()
@@ -41,15 +68,32 @@ class Hero(Sprite):
     def __init__(self):
         super().__init__()
         self.image = load_image("hero.png")
-        self.velocity = Vector2(0, 0)
-        self.position = Vector2(400, 400)
-        self.old_position = self.position.copy()
-        self.rect = self.image.get_rect(topleft=self.position)
+        self.vx = self.vy = 0.0
+        self.px, self.py = 400.0, 400.0
+        self.old_px, self.old_py = self.px, self.py
+        self.rect = self.image.get_rect(topleft=(self.px, self.py))
+
+    @property
+    def position(self) -> Vector2:
+        return Vector2(self.px, self.py)
+
+    @position.setter
+    def position(self, value: Vector2D) -> None:
+        self.px, self.py = float(value[0]), float(value[1])
+
+    @property
+    def velocity(self) -> Vector2:
+        return Vector2(self.vx, self.vy)
+
+    @velocity.setter
+    def velocity(self, value: Vector2D) -> None:
+        self.vx, self.vy = float(value[0]), float(value[1])
 
     def update(self, dt: float):
-        self.old_position = self.position.copy()
-        self.position += self.velocity * dt
-        self.rect.topleft = self.position
+        self.old_px, self.old_py = self.px, self.py
+        self.px += self.vx * dt
+        self.py += self.vy * dt
+        self.rect.topleft = (self.px, self.py)
 
 
 class CameraDemo:
@@ -70,8 +114,11 @@ class CameraDemo:
             ("stitched8.tmx", (20, 20)),
         ]
 
-        for filename, offset in stitched_maps:
-            tmx = load_pygame(str(RESOURCES_DIR / filename))
+        paths = [str(RESOURCES_DIR / filename) for filename, _ in stitched_maps]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tmxs = list(executor.map(load_pygame, paths))
+
+        for tmx, (_, offset) in zip(tmxs, stitched_maps):
             world_data.add_map(TiledMapData(tmx), offset)
 
         self.map_layer = BufferedRenderer(
@@ -95,62 +142,50 @@ class CameraDemo:
 
         self.camera_manager = CameraManager(self.cam_smooth)
 
+        set_camera = self.camera_manager.set_camera
+        self._keydown_table: dict[int, Callable[[], None]] = {
+            K_ESCAPE: self._quit,
+            K_1: partial(set_camera, self.cam_smooth, duration=1.0),
+            K_2: partial(set_camera, self.cam_platformer, duration=1.0),
+            K_3: partial(set_camera, self.cam_zoom, duration=1.0),
+            K_4: partial(set_camera, self.cam_cutscene, duration=1.0),
+            K_5: partial(set_camera, self.cam_debug, duration=0.5),
+            K_EQUALS: self._zoom_in,
+            K_MINUS: self._zoom_out,
+        }
+
+    def _quit(self):
+        self.running = False
+
+    def _zoom_in(self):
+        self.map_layer.zoom += ZOOM_STEP
+
+    def _zoom_out(self):
+        if self.map_layer.zoom - ZOOM_STEP > 0:
+            self.map_layer.zoom -= ZOOM_STEP
+
     def handle_input(self):
+        keydown_table = self._keydown_table
         for event in pygame.event.get():
-            if event.type == pygame.locals.QUIT:
+            event_type = event.type
+            if event_type == KEYDOWN:
+                action = keydown_table.get(event.key)
+                if action is not None:
+                    action()
+            elif event_type == QUIT:
                 self.running = False
-            elif event.type == pygame.locals.KEYDOWN:
-                if event.key == pygame.locals.K_ESCAPE:
-                    self.running = False
-
-                elif event.key == pygame.locals.K_1:
-                    self.camera_manager.set_camera(self.cam_smooth, duration=1.0)
-                elif event.key == pygame.locals.K_2:
-                    self.camera_manager.set_camera(self.cam_platformer, duration=1.0)
-                elif event.key == pygame.locals.K_3:
-                    self.camera_manager.set_camera(self.cam_zoom, duration=1.0)
-                elif event.key == pygame.locals.K_4:
-                    self.camera_manager.set_camera(self.cam_cutscene, duration=1.0)
-                elif event.key == pygame.locals.K_5:
-                    self.camera_manager.set_camera(self.cam_debug, duration=0.5)
-
-                elif event.key == pygame.locals.K_EQUALS:
-                    self.map_layer.zoom += ZOOM_STEP
-                elif (
-                    event.key == pygame.locals.K_MINUS
-                    and self.map_layer.zoom - ZOOM_STEP > 0
-                ):
-                    self.map_layer.zoom -= ZOOM_STEP
-
-            elif event.type == pygame.locals.VIDEORESIZE:
+            elif event_type == VIDEORESIZE:
                 self.screen = pygame.display.set_mode(
                     (event.w, event.h), pygame.RESIZABLE
                 )
                 self.map_layer.set_size((event.w, event.h))
 
         pressed = pygame.key.get_pressed()
-        self.hero.velocity.xy = 0, 0
-
-        if pressed[pygame.locals.K_UP]:
-            self.hero.velocity.y = -HERO_MOVE_SPEED
-        elif pressed[pygame.locals.K_DOWN]:
-            self.hero.velocity.y = HERO_MOVE_SPEED
-
-        if pressed[pygame.locals.K_LEFT]:
-            self.hero.velocity.x = -HERO_MOVE_SPEED
-        elif pressed[pygame.locals.K_RIGHT]:
-            self.hero.velocity.x = HERO_MOVE_SPEED
-
-        dx = dy = 0
-        if pressed[pygame.locals.K_w]:
-            dy = -1
-        if pressed[pygame.locals.K_s]:
-            dy = 1
-        if pressed[pygame.locals.K_a]:
-            dx = -1
-        if pressed[pygame.locals.K_d]:
-            dx = 1
-        self.cam_debug.set_input(dx, dy)
+        self.hero.vx = (pressed[K_RIGHT] - pressed[K_LEFT]) * HERO_MOVE_SPEED
+        self.hero.vy = (pressed[K_DOWN] - pressed[K_UP]) * HERO_MOVE_SPEED
+        self.cam_debug.set_input(
+            pressed[K_d] - pressed[K_a], pressed[K_s] - pressed[K_w]
+        )
 
     def update(self, dt: float):
         self.group.update(dt)
@@ -9,6 +9,8 @@ Very basic!  No animations.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -39,6 +41,8 @@ from pyscroll.orthographic import BufferedRenderer
 if TYPE_CHECKING:
     from pygame.surface import Surface
 
+    from pyscroll.common import Vector2D
+
 # define configuration variables here
 CURRENT_DIR = Path(__file__).parent
 RESOURCES_DIR = CURRENT_DIR
@@ -52,7 +56,9 @@ def init_screen(width: int, height: int) -> Surface:
     return pygame.display.set_mode((width, height), pygame.RESIZABLE)
 
 
+@lru_cache(maxsize=64)
 def load_image(filename: str) -> Surface:
+    # cached: only call after the display is set, convert_alpha() needs it
     path = RESOURCES_DIR / filename
     if not path.exists():
         raise FileNotFoundError(f"Image not found: {path}")
@@ -63,10 +69,11 @@ class Hero(Sprite):
     def __init__(self) -> None:
         super().__init__()
         self.image = load_image("hero.png")
-        self.velocity = Vector2(0, 0)
-        self.position = Vector2(400.0, 400.0)
-        self.old_position = self.position.copy()
-        self.rect = self.image.get_rect(topleft=self.position)
+        # plain floats: Vector2 math would allocate temporaries every update
+        self.vx = self.vy = 0.0
+        self.px, self.py = 400.0, 400.0
+        self.old_px, self.old_py = self.px, self.py
+        self.rect = self.image.get_rect(topleft=(self.px, self.py))
         self.feet = Rect(0, 0, self.rect.width * 0.5, 8)
         self.update_feet()
 
@@ -74,22 +81,31 @@ class Hero(Sprite):
         self.feet.midbottom = self.rect.midbottom
 
     @property
-    def position(self) -> list[float]:
-        return list(self._position)
+    def position(self) -> Vector2:
+        return Vector2(self.px, self.py)
 
     @position.setter
-    def position(self, value: list[float]) -> None:
-        self._position = list(value)
+    def position(self, value: Vector2D) -> None:
+        self.px, self.py = float(value[0]), float(value[1])
+
+    @property
+    def velocity(self) -> Vector2:
+        return Vector2(self.vx, self.vy)
+
+    @velocity.setter
+    def velocity(self, value: Vector2D) -> None:
+        self.vx, self.vy = float(value[0]), float(value[1])
 
     def update(self, dt: float) -> None:
-        self.old_position = self.position.copy()
-        self.position += self.velocity * dt
-        self.rect.topleft = self.position
+        self.old_px, self.old_py = self.px, self.py
+        self.px += self.vx * dt
+        self.py += self.vy * dt
+        self.rect.topleft = (self.px, self.py)
         self.update_feet()
 
     def move_back(self, dt: float) -> None:
-        self.position = self.old_position.copy()
-        self.rect.topleft = self.position
+        self.px, self.py = self.old_px, self.old_py
+        self.rect.topleft = (self.px, self.py)
         self.update_feet()
 
 
@@ -113,11 +129,18 @@ class QuestGame:
             ("stitched8.tmx", (20, 20)),
         ]
 
-        for filename, offset in stitched_maps:
+        paths = []
+        for filename, _ in stitched_maps:
             path = RESOURCES_DIR / filename
             if not path.exists():
                 raise FileNotFoundError(f"TMX map not found: {path}")
-            tmx_data = load_pygame(str(path))
+            paths.append(str(path))
+
+        # parse the maps concurrently; add_map stays serial and in order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tmxs = list(executor.map(load_pygame, paths))
+
+        for tmx_data, (_, offset) in zip(tmxs, stitched_maps):
             world_data.add_map(TiledMapData(tmx_data), offset)
 
         self.map_layer = BufferedRenderer(
@@ -157,18 +180,8 @@ class QuestGame:
                 self.map_layer.set_size((event.w, event.h))
 
         pressed = pygame.key.get_pressed()
-        self.hero.velocity.x = 0
-        self.hero.velocity.y = 0
-
-        if pressed[K_UP]:
-            self.hero.velocity.y = -HERO_MOVE_SPEED
-        elif pressed[K_DOWN]:
-            self.hero.velocity.y = HERO_MOVE_SPEED
-
-        if pressed[K_LEFT]:
-            self.hero.velocity.x = -HERO_MOVE_SPEED
-        elif pressed[K_RIGHT]:
-            self.hero.velocity.x = HERO_MOVE_SPEED
+        self.hero.vx = (pressed[K_RIGHT] - pressed[K_LEFT]) * HERO_MOVE_SPEED
+        self.hero.vy = (pressed[K_DOWN] - pressed[K_UP]) * HERO_MOVE_SPEED
 
     def update(self, dt: float) -> None:
         self.group.update(dt)
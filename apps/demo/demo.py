@@ -6,13 +6,18 @@ Rendering demo for the pyscroll.
 
 Use the arrow keys to smoothly scroll the map.
 Window is resizable.
+Pass --threaded to draw the map on a worker thread.
 
 See the "Quest" tutorial for a more simple use with
 pygame sprites and groups.
 """
 
 import logging
-from collections import deque
+import queue
+import sys
+import threading
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 
 import pygame
@@ -31,7 +36,6 @@ from pygame.locals import (
     K_s,
     K_w,
 )
-from pygame.math import Vector2
 from pygame.surface import Surface
 from pytmx.util_pygame import load_pygame  # type: ignore
 
@@ -47,12 +51,19 @@ FONT_SIZE = 20
 TEXT_COLOR = (180, 180, 0)
 FRICTION_BASE = 0.0001
 WINDOW_SIZE = (800, 600)
+FPS_AVERAGE_FRAMES = 20
 
 
 def init_screen(width: int, height: int) -> Surface:
     return pygame.display.set_mode((width, height), pygame.RESIZABLE)
 
 
+@lru_cache(maxsize=1)
+def get_font() -> Font:
+    """Load the overlay font once; shared by every ScrollTest."""
+    return Font(pygame.font.get_default_font(), FONT_SIZE)
+
+
 class ScrollTest:
     """
     Test and demo of pyscroll
@@ -60,8 +71,15 @@ class ScrollTest:
     For normal use, please see the quest demo, not this.
     """
 
-    def __init__(self, filename: Path, screen: Surface) -> None:
+    def __init__(
+        self,
+        filename: Path,
+        screen: Surface,
+        threaded_draw: bool = False,
+    ) -> None:
         self.screen = screen
+        # opt-in: render the map on a worker; display calls stay on this thread
+        self.threaded_draw = threaded_draw
 
         # Load TMX map
         tmx_data = load_pygame(filename.as_posix())
@@ -69,19 +87,21 @@ class ScrollTest:
         self.map_layer = BufferedRenderer(map_data, screen.get_size())
 
         # Text overlay
-        font = Font(pygame.font.get_default_font(), FONT_SIZE)
+        font = get_font()
         messages = ["Scroll demo. Press ESC to quit", "Arrow keys or WASD to move"]
         self.text_overlay = [font.render(msg, True, TEXT_COLOR) for msg in messages]
         self.font = font
 
         # Camera setup
-        self.center = Vector2(
-            self.map_layer.map_rect.width / 2, self.map_layer.map_rect.height / 2
-        )
-        self.camera_acc = Vector2(0, 0)
-        self.camera_vel = Vector2(0, 0)
+        # scalar floats: Vector2 math would allocate temporaries every update
+        self.center_x = self.map_layer.map_rect.width / 2
+        self.center_y = self.map_layer.map_rect.height / 2
+        self.acc_x = self.acc_y = 0.0
+        self.vel_x = self.vel_y = 0.0
         self.last_update_time = 0.0
 
+        self.fps = 0.0
+        self._fps_cache: tuple[int, Surface | None] = (-1, None)
         self.running = False
 
     def draw(self) -> None:
@@ -94,7 +114,12 @@ class ScrollTest:
             self.screen.blit(text, (0, y))
             y += text.get_height()
 
-        fps_text = self.font.render(f"FPS: {int(self.fps)}", True, TEXT_COLOR)
+        # font rendering is costly; only re-render when the shown value changes
+        fps = int(self.fps)
+        fps_text = self._fps_cache[1]
+        if fps != self._fps_cache[0] or fps_text is None:
+            fps_text = self.font.render(f"FPS: {fps}", True, TEXT_COLOR)
+            self._fps_cache = (fps, fps_text)
         self.screen.blit(fps_text, (self.screen.get_width() - 100, 0))
 
     def handle_input(self) -> None:
@@ -107,50 +132,89 @@ class ScrollTest:
                 self.map_layer.set_size((event.w, event.h))
 
         pressed = pygame.key.get_pressed()
-        self.camera_acc = Vector2(0, 0)
-
-        if pressed[K_UP] or pressed[K_w]:
-            self.camera_acc.y = -SCROLL_SPEED * self.last_update_time
-        elif pressed[K_DOWN] or pressed[K_s]:
-            self.camera_acc.y = SCROLL_SPEED * self.last_update_time
-
-        if pressed[K_LEFT] or pressed[K_a]:
-            self.camera_acc.x = -SCROLL_SPEED * self.last_update_time
-        elif pressed[K_RIGHT] or pressed[K_d]:
-            self.camera_acc.x = SCROLL_SPEED * self.last_update_time
+        # key states are 0/1, so opposing keys cancel out
+        ax = (pressed[K_RIGHT] or pressed[K_d]) - (pressed[K_LEFT] or pressed[K_a])
+        ay = (pressed[K_DOWN] or pressed[K_s]) - (pressed[K_UP] or pressed[K_w])
+        speed = SCROLL_SPEED * self.last_update_time
+        self.acc_x = ax * speed
+        self.acc_y = ay * speed
 
     def update(self, dt: float) -> None:
         self.last_update_time = dt
         friction = FRICTION_BASE**dt
 
-        self.camera_vel += self.camera_acc * dt
-        self.camera_vel *= friction
-        self.center += self.camera_vel
+        self.vel_x = (self.vel_x + self.acc_x * dt) * friction
+        self.vel_y = (self.vel_y + self.acc_y * dt) * friction
 
         # Clamp to map bounds
-        self.center.x = max(0, min(self.center.x, self.map_layer.map_rect.width))
-        self.center.y = max(0, min(self.center.y, self.map_layer.map_rect.height))
+        map_rect = self.map_layer.map_rect
+        self.center_x = max(0.0, min(self.center_x + self.vel_x, map_rect.width))
+        self.center_y = max(0.0, min(self.center_y + self.vel_y, map_rect.height))
 
-        self.map_layer.center(self.center)
+        self.map_layer.center((self.center_x, self.center_y))
 
     def run(self) -> None:
         clock = pygame.time.Clock()
         self.running = True
-        fps_log: deque[float] = deque(maxlen=20)
+        # running sum over a fixed ring of samples: O(1) per frame
+        fps_ring = [0.0] * FPS_AVERAGE_FRAMES
+        fps_index = 0
+        fps_sum = 0.0
+
+        # when threaded, the worker renders into the screen surface while
+        # this thread sleeps in tick(); flip, events and set_mode stay here
+        requests: queue.Queue[bool] = queue.Queue(maxsize=1)
+        drawn = threading.Event()
+        drawn.set()
+        if self.threaded_draw:
+            worker = threading.Thread(
+                target=self._draw_worker, args=(requests, drawn), daemon=True
+            )
+            worker.start()
 
         while self.running:
-            clock.tick(120)
-            try:
-                fps_log.append(clock.get_fps())
-                self.fps = sum(fps_log) / len(fps_log)
-                dt = 1 / self.fps if self.fps > 0 else 0.016
-            except ZeroDivisionError:
+            # tick() returns the milliseconds since the previous frame
+            dt = clock.tick(120) * 0.001
+
+            fps = clock.get_fps()
+            fps_sum += fps - fps_ring[fps_index]
+            fps_ring[fps_index] = fps
+            fps_index = (fps_index + 1) % FPS_AVERAGE_FRAMES
+            self.fps = fps_sum / FPS_AVERAGE_FRAMES
+
+            if not self.threaded_draw:
+                self.handle_input()
+                self.update(dt)
+                self.draw()
+                pygame.display.flip()
                 continue
 
+            # wait for the previous frame; the map must not change mid-draw
+            drawn.wait()
+            drawn.clear()
+            pygame.display.flip()
             self.handle_input()
             self.update(dt)
-            self.draw()
-            pygame.display.flip()
+            requests.put(True)
+
+        if self.threaded_draw:
+            # a worker that stopped on an error leaves the last request
+            # queued; drop it so the stop signal cannot block on a full queue
+            with suppress(queue.Empty):
+                requests.get_nowait()
+            requests.put(False)
+            worker.join()
+
+    def _draw_worker(self, requests: queue.Queue[bool], drawn: threading.Event) -> None:
+        """Draw a frame each time the main thread asks for one; it flips it"""
+        while requests.get():
+            try:
+                self.draw()
+            except Exception:
+                self.running = False
+                raise
+            finally:
+                drawn.set()
 
 
 def main() -> None:
@@ -167,7 +231,7 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        ScrollTest(filename, screen).run()
+        ScrollTest(filename, screen, threaded_draw="--threaded" in sys.argv).run()
     except Exception as e:
         logger.exception("An error occurred during execution.")
         pygame.quit()
@@ -175,6 +239,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    import sys
-
     main()
@@ -15,50 +15,39 @@ def main():
     clock = pygame.time.Clock()
 
     data = ProceduralData()
+    # the renderer processes the animation queue for the visible tiles on draw
     renderer = BufferedRenderer(data, (800, 600))
 
-    renderer.center(
-        (
-            data.map_size[0] * data.tile_size[0] // 2,
-            data.map_size[1] * data.tile_size[1] // 2,
-        )
-    )
+    # map center in pixels; only the offset changes from frame to frame
+    cx0 = data.map_size[0] * data.tile_size[0] // 2
+    cy0 = data.map_size[1] * data.tile_size[1] // 2
+    renderer.center((cx0, cy0))
 
     offset_x, offset_y = 0, 0
     zoom = 1.0
 
+    renderer_center = renderer.center
+    get_events = pygame.event.get
+    get_pressed = pygame.key.get_pressed
+
     running = True
     while running:
-        for event in pygame.event.get():
+        for event in get_events():
             if event.type == pygame.QUIT or (
                 event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE
             ):
                 running = False
 
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            offset_x -= 10
-        if keys[pygame.K_RIGHT]:
-            offset_x += 10
-        if keys[pygame.K_UP]:
-            offset_y -= 10
-        if keys[pygame.K_DOWN]:
-            offset_y += 10
+        keys = get_pressed()
+        offset_x += (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * 10
+        offset_y += (keys[pygame.K_DOWN] - keys[pygame.K_UP]) * 10
         if keys[pygame.K_PLUS] or keys[pygame.K_EQUALS]:  # '+' key
             zoom = min(2.0, zoom + 0.05)
         if keys[pygame.K_MINUS]:
             zoom = max(0.5, zoom - 0.05)
 
         renderer.zoom = zoom
-        renderer.center(
-            (
-                data.map_size[0] * data.tile_size[0] // 2 + offset_x,
-                data.map_size[1] * data.tile_size[1] // 2 + offset_y,
-            )
-        )
-
-        data._update_time()
-        data.process_animation_queue(renderer._tile_view)
+        renderer_center((cx0 + offset_x, cy0 + offset_y))
 
         screen.fill((0, 0, 0))
         renderer.draw(screen, screen.get_rect(), [])
@@ -16,15 +16,23 @@ FPS = 30
 def generate_tile_rects(n, bounds=(0, 0, 800, 600), tile_size=(32, 32)):
     x0, y0, w, h = bounds
     tw, th = tile_size
-    return [
-        Rect(
-            random.randint(x0, x0 + w - tw),
-            random.randint(y0, y0 + h - th),
-            tw,
-            th,
-        )
-        for _ in range(n)
-    ]
+    xs = random.choices(range(x0, x0 + w - tw + 1), k=n)
+    ys = random.choices(range(y0, y0 + h - th + 1), k=n)
+    return [Rect(x, y, tw, th) for x, y in zip(xs, ys)]
+
+
+def render_hit_text(font, hit_count):
+    return font.render(
+        f"Hits: {hit_count}  |  Press H to toggle", True, (240, 240, 240)
+    )
+
+
+def render_background(tile_rects):
+    background = pygame.Surface(SCREEN_SIZE).convert()
+    background.fill((30, 30, 30))
+    for rect in tile_rects:
+        pygame.draw.rect(background, (120, 120, 120), rect, 1)
+    return background
 
 
 def main():
@@ -38,11 +46,19 @@ def main():
     )
     tree = FastQuadTree(tile_rects, depth=DEPTH)
 
+    # the tile outlines never change, so draw them once and blit per frame
+    background = render_background(tile_rects)
+
+    # the tree and query are static; only query again if the rect moves
+    query_rect = QUERY_RECT.copy()
+    hits = tree.hit(query_rect)
+    text = render_hit_text(font, len(hits))
+
     running = True
     show_hits = True
 
     while running:
-        screen.fill((30, 30, 30))
+        screen.blit(background, (0, 0))
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -50,19 +66,19 @@ def main():
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_h:
                 show_hits = not show_hits
 
-        for rect in tile_rects:
-            pygame.draw.rect(screen, (120, 120, 120), rect, 1)
-
         pygame.draw.rect(screen, (0, 128, 255), QUERY_RECT, 2)
 
-        hits = tree.hit(QUERY_RECT)
+        if query_rect != QUERY_RECT:
+            query_rect = QUERY_RECT.copy()
+            hit_count = len(hits)
+            hits = tree.hit(query_rect)
+            if len(hits) != hit_count:
+                text = render_hit_text(font, len(hits))
+
         if show_hits:
             for hit_rect in hits:
                 pygame.draw.rect(screen, (255, 0, 0), hit_rect, 2)
 
-        text = font.render(
-            f"Hits: {len(hits)}  |  Press H to toggle", True, (240, 240, 240)
-        )
         screen.blit(text, (10, 10))
 
         pygame.display.flip()
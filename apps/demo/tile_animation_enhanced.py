@@ -10,6 +10,7 @@ This demo showcases:
 """
 
 import random
+from functools import lru_cache
 
 import pygame
 from pygame.locals import QUIT
@@ -17,12 +18,19 @@ from pygame.locals import QUIT
 from pyscroll.animation import AnimationFrame, AnimationToken
 
 
+@lru_cache(maxsize=256)
+def solid_surface(color, w, h) -> pygame.Surface:
+    """Return a shared surface filled with color; tokens reuse these."""
+    surf = pygame.Surface((w, h)).convert()
+    surf.fill(color)
+    return surf
+
+
 def make_frames(colors, size=(32, 32), base_duration=0.4) -> list[AnimationFrame]:
     """Create frames with optional per-frame speed multipliers."""
     frames = []
     for color in colors:
-        surf = pygame.Surface(size).convert()
-        surf.fill(color)
+        surf = solid_surface(color, *size)
 
         # Random per-frame speed multiplier (0.5x to 2x)
         frame_speed = random.uniform(0.5, 2.0)
@@ -90,6 +98,11 @@ def main():
 
     tokens = create_tokens(20, tile_size, screen_size)
 
+    # positions are fixed, so unpack the blit destinations once
+    placements = [
+        (token, tuple((x, y) for x, y, _ in token.positions)) for token in tokens
+    ]
+
     current_time = 0.0
     running = True
 
@@ -103,10 +116,12 @@ def main():
 
         screen.fill((20, 20, 20))
 
-        for token in tokens:
-            frame = token.update(current_time, elapsed)
-            for pos in token.positions:
-                screen.blit(frame.image, (pos[0], pos[1]))
+        images = [
+            (token.update(current_time, elapsed).image, dests)
+            for token, dests in placements
+        ]
+        blit_seq = [(image, dest) for image, dests in images for dest in dests]
+        screen.blits(blit_seq, doreturn=False)
 
         pygame.display.flip()
 
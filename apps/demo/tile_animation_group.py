@@ -20,10 +20,12 @@ from pyscroll.animation import AnimationFrame, AnimationToken
 
 
 def make_color_frames(colors, size=(32, 32), duration=0.4) -> list[AnimationFrame]:
-    return [
-        AnimationFrame(image=pygame.Surface(size).convert(), duration=duration)
-        for color in colors
-    ]
+    frames = []
+    for color in colors:
+        surf = pygame.Surface(size).convert()
+        surf.fill(color)
+        frames.append(AnimationFrame(image=surf, duration=duration))
+    return frames
 
 
 def create_tokens(count, tile_size, screen_size) -> list[AnimationToken]:
@@ -35,12 +37,7 @@ def create_tokens(count, tile_size, screen_size) -> list[AnimationToken]:
 
         # Alternate colors for demonstration
         colors = [random.choice([(255, 0, 0), (0, 255, 0), (0, 0, 255)]), (0, 0, 0)]
-        frames = [
-            AnimationFrame(image=pygame.Surface((tile_size, tile_size)), duration=0.4)
-            for color in colors
-        ]
-        for frame, color in zip(frames, colors):
-            frame.image.fill(color)
+        frames = make_color_frames(colors, size=(tile_size, tile_size))
 
         token = AnimationToken(position, frames, loop=True)
         tokens.append(token)
@@ -57,6 +54,10 @@ def main():
     tile_size = 32
     tokens = create_tokens(12, tile_size, screen_size)
 
+    placements = [
+        (token, tuple((x, y) for x, y, _ in token.positions)) for token in tokens
+    ]
+
     current_time = 0.0
 
     running = True
@@ -70,10 +71,12 @@ def main():
 
         screen.fill((30, 30, 30))
 
-        for token in tokens:
-            frame = token.update(current_time, elapsed)
-            for pos in token.positions:
-                screen.blit(frame.image, (pos[0], pos[1]))
+        images = [
+            (token.update(current_time, elapsed).image, dests)
+            for token, dests in placements
+        ]
+        blit_seq = [(image, dest) for image, dests in images for dest in dests]
+        screen.blits(blit_seq, doreturn=False)
 
         pygame.display.flip()
 
@@ -11,7 +11,7 @@ Purpose:
 """
 
 import pygame
-from pygame.locals import QUIT
+from pygame.locals import QUIT, WINDOWEXPOSED
 
 from pyscroll.animation import AnimationFrame, AnimationToken
 
@@ -40,6 +40,7 @@ def main() -> None:
     anim = AnimationToken(positions, frames, loop=True)
 
     current_time = 0.0  # simulated time
+    last_image = None  # image on screen; redraw only when it changes
 
     running = True
     while running:
@@ -49,11 +50,16 @@ def main() -> None:
         for event in pygame.event.get():
             if event.type == QUIT:
                 running = False
-
-        screen.fill((30, 30, 30))
+            elif event.type == WINDOWEXPOSED:
+                last_image = None
 
         # Update and draw current animation frame
         frame = anim.update(current_time, elapsed)
+        if frame.image is last_image:
+            continue
+        last_image = frame.image
+
+        screen.fill((30, 30, 30))
         screen.blit(frame.image, (100, 100))
 
         pygame.display.flip()
@@ -5,7 +5,7 @@ Draws translated rectangles and points for dummy sprites.
 """
 
 import pygame
-from pygame.locals import QUIT
+from pygame.locals import QUIT, WINDOWEXPOSED
 from pygame.math import Vector2
 from pygame.rect import Rect
 from pygame.sprite import Group, Sprite
@@ -24,17 +24,32 @@ class DummyMapLayer:
     def __init__(self, offset: Vector2 = Vector2(100, 100)) -> None:
         self.offset = offset
 
+    @property
+    def offset(self) -> Vector2:
+        return Vector2(self._offset)
+
+    @offset.setter
+    def offset(self, value: Vector2) -> None:
+        # the offset rarely changes, so convert to ints here instead of per call
+        self._offset = Vector2(value)
+        self._ox = int(value[0])
+        self._oy = int(value[1])
+
     def translate_rect(self, rect: Rect) -> Rect:
-        return rect.move(-self.offset.x, -self.offset.y)
+        return rect.move(-self._ox, -self._oy)
 
     def translate_point(self, point: tuple[int, int]) -> tuple[int, int]:
-        return (point[0] - int(self.offset.x), point[1] - int(self.offset.y))
+        return (point[0] - self._ox, point[1] - self._oy)
 
     def translate_rects(self, rects: list[Rect]) -> list[Rect]:
-        return [self.translate_rect(r) for r in rects]
+        ox = -self._ox
+        oy = -self._oy
+        return [r.move(ox, oy) for r in rects]
 
     def translate_points(self, points: list[tuple[int, int]]) -> list[tuple[int, int]]:
-        return [self.translate_point(p) for p in points]
+        ox = self._ox
+        oy = self._oy
+        return [(x - ox, y - oy) for x, y in points]
 
 
 class Dummy:
@@ -53,11 +68,20 @@ class Dummy:
     def run(self) -> None:
         clock = pygame.time.Clock()
         running = True
+        # nothing moves in this scene; only redraw when the window needs it
+        dirty = True
 
         while running:
             for event in pygame.event.get():
                 if event.type == QUIT:
                     running = False
+                elif event.type == WINDOWEXPOSED:
+                    dirty = True
+
+            if not dirty:
+                clock.tick(60)
+                continue
+            dirty = False
 
             self.screen.fill((30, 30, 30))
 
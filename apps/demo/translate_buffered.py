@@ -49,6 +49,32 @@ class TranslateTest:
             DummySprite(460, 360),
             DummySprite(500, 400),
         )
+        # the list holds the sprites' own Rects, so it stays current if they move
+        self.rects = [spr.rect for spr in self.sprites]
+
+        # translated geometry, recomputed only when the camera or a sprite moves
+        self._translate_key: tuple | None = None
+        self._single: list[tuple[Rect, tuple[int, int]]] = []
+        self._batch: list[Rect] = []
+
+    def translate_sprites(self) -> None:
+        map_layer = self.map_layer
+        key = (
+            map_layer.zoom,
+            map_layer.view_rect.topleft,
+            tuple(tuple(rect) for rect in self.rects),
+        )
+        if key == self._translate_key:
+            return
+        self._translate_key = key
+
+        self._single = [
+            (map_layer.translate_rect(rect), map_layer.translate_point(rect.topleft))
+            for rect in self.rects
+        ]
+        # a translated topleft is the topleft of the translated rect, so one
+        # batched call serves both rects and points
+        self._batch = map_layer.translate_rects(self.rects)
 
     def run(self) -> None:
         clock = pygame.time.Clock()
@@ -64,25 +90,17 @@ class TranslateTest:
             # Draw map
             self.map_layer.draw(self.screen, self.screen.get_rect(), [])
 
-            # Draw translated rects
-            for spr in self.sprites:
-                r = self.map_layer.translate_rect(spr.rect)
-                pygame.draw.rect(self.screen, (20, 200, 20), r, 2)
+            self.translate_sprites()
 
-            # Draw translated points
-            for spr in self.sprites:
-                p = self.map_layer.translate_point(spr.rect.topleft)
+            # Draw translated rects and points in a single pass
+            for r, p in self._single:
+                pygame.draw.rect(self.screen, (20, 200, 20), r, 2)
                 pygame.draw.circle(self.screen, (20, 20, 200), p, 4)
 
-            # Batch rects
-            rects = [spr.rect for spr in self.sprites]
-            for r in self.map_layer.translate_rects(rects):
+            # Batch rects and points
+            for r in self._batch:
                 pygame.draw.rect(self.screen, (200, 10, 10), r, 1)
-
-            # Batch points
-            points = [r.topleft for r in rects]
-            for p in self.map_layer.translate_points(points):
-                pygame.draw.circle(self.screen, (200, 10, 10), p, 3)
+                pygame.draw.circle(self.screen, (200, 10, 10), r.topleft, 3)
 
             pygame.display.flip()
             clock.tick(60)
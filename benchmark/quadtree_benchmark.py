@@ -9,27 +9,22 @@ from pyscroll.quadtree import FastQuadTree
 def generate_rects(n, bounds=(0, 0, 800, 600), tile_size=(32, 32)):
     x0, y0, w, h = bounds
     tw, th = tile_size
-    return [
-        Rect(
-            random.randint(x0, x0 + w - tw),
-            random.randint(y0, y0 + h - th),
-            tw,
-            th,
-        )
-        for _ in range(n)
-    ]
+    xs = random.choices(range(x0, x0 + w - tw + 1), k=n)
+    ys = random.choices(range(y0, y0 + h - th + 1), k=n)
+    return [Rect(x, y, tw, th) for x, y in zip(xs, ys)]
 
 
 def brute_force_hit(items, target):
-    return [r for r in items if r.colliderect(target)]
+    # collidelistall runs the whole scan in C, so the baseline measures the
+    # linear search itself rather than per-rect Python call overhead
+    return [items[i] for i in target.collidelistall(items)]
 
 
 def run_benchmark(item_count, query_count=1000, depth=4):
     items = generate_rects(item_count)
-    queries = [
-        Rect(random.randint(0, 800), random.randint(0, 600), 64, 64)
-        for _ in range(query_count)
-    ]
+    qxs = random.choices(range(801), k=query_count)
+    qys = random.choices(range(601), k=query_count)
+    queries = [Rect(x, y, 64, 64) for x, y in zip(qxs, qys)]
 
     start = timeit.default_timer()
     tree = FastQuadTree(items, depth=depth)
@@ -40,21 +35,26 @@ def run_benchmark(item_count, query_count=1000, depth=4):
         tree.hit(q)
     quadtree_time = timeit.default_timer() - start
 
+    start = timeit.default_timer()
+    tree.hit_batch(queries)
+    batch_time = timeit.default_timer() - start
+
     start = timeit.default_timer()
     for q in queries:
         brute_force_hit(items, q)
     brute_time = timeit.default_timer() - start
 
-    return build_time, quadtree_time, brute_time
+    return build_time, quadtree_time, batch_time, brute_time
 
 
 def benchmark_series(sizes=(1000, 5000, 10000, 20000), query_count=1000, depth=4):
     print(f"query_count={query_count}, depth={depth}")
     for n in sizes:
-        build, qt_time, bf_time = run_benchmark(n, query_count, depth)
+        build, qt_time, batch_time, bf_time = run_benchmark(n, query_count, depth)
         print(f"{n} rects:")
         print(f"  Build:       {build:.6f}s")
         print(f"  Quadtree:    {qt_time:.6f}s")
+        print(f"  Batched:     {batch_time:.6f}s")
         print(f"  Brute-force: {bf_time:.6f}s")
         print()
 
@@ -10,15 +10,9 @@ from pyscroll.quadtree import FastQuadTree
 def generate_tile_rects(n, bounds=(0, 0, 800, 600), tile_size=(32, 32)):
     x0, y0, w, h = bounds
     tw, th = tile_size
-    return [
-        Rect(
-            random.randint(x0, x0 + w - tw),
-            random.randint(y0, y0 + h - th),
-            tw,
-            th,
-        )
-        for _ in range(n)
-    ]
+    xs = random.choices(range(x0, x0 + w - tw + 1), k=n)
+    ys = random.choices(range(y0, y0 + h - th + 1), k=n)
+    return [Rect(x, y, tw, th) for x, y in zip(xs, ys)]
 
 
 def run_benchmark(depth, item_count, query_count, repeats=3):
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING, TypeAlias
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Mapping, Sequence
 
     from pygame.surface import Surface
 
@@ -15,7 +15,7 @@ Position: TypeAlias = tuple[int, int, int]
 __all__ = ("AnimationFrame", "AnimationToken")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnimationFrame:
     """
     Represents a single frame in an animation.
@@ -31,6 +31,43 @@ class AnimationFrame:
     frame_speed_multiplier: float = 1.0
 
 
+_Transition: TypeAlias = tuple[int, int, bool]
+
+
+def _build_transitions(
+    last_index: int, loop: bool, ping_pong: bool
+) -> dict[int, tuple[_Transition, ...]]:
+    """
+    Precompute the step taken from every (direction, index) state.
+
+    Each entry is (new index, new direction, finished). The result maps a
+    direction (1 or -1) to its table, indexed by frame, so a token looks
+    up its step without branching on its flags.
+    """
+
+    def step(index: int, direction: int) -> _Transition:
+        if ping_pong:
+            if index == last_index and direction == 1:
+                direction = -1
+            elif index == 0 and direction == -1:
+                if not loop:
+                    return index, direction, True
+                direction = 1
+            index = min(max(index + direction, 0), last_index)
+            return index, direction, not loop and index == 0 and direction == -1
+
+        if index == last_index:
+            if loop:
+                return 0, direction, False
+            return index, direction, True
+        return index + 1, direction, False
+
+    indices = range(last_index + 1)
+    forward = tuple(step(i, 1) for i in indices)
+    backward = tuple(step(i, -1) for i in indices)
+    return {1: forward, -1: backward}
+
+
 class AnimationToken:
     """
     Manages tile-based animation logic including frame timing, looping, and updates.
@@ -51,12 +88,15 @@ class AnimationToken:
         "positions",
         "frames",
         "_durations",
+        "_last_index",
+        "_period",
+        "_transitions",
+        "_loop",
+        "_ping_pong",
         "next",
         "index",
-        "loop",
         "done",
         "speed_multiplier",
-        "ping_pong",
         "direction",
         "on_complete",
         "_completed",
@@ -82,8 +122,9 @@ class AnimationToken:
 
         self.positions = positions
         self.frames = tuple(frames)
-        self.loop = loop
-        self.ping_pong = ping_pong
+        self._last_index = len(self.frames) - 1
+        self._loop = loop
+        self._ping_pong = ping_pong
         self.speed_multiplier = speed_multiplier
         self.done = False
         self.direction = 1
@@ -99,6 +140,8 @@ class AnimationToken:
             )
             for f in self.frames
         )
+        self._period = sum(self._durations)
+        self._rebuild_transitions()
 
         # Optional random starting frame
         self.index = random.randrange(len(self.frames)) if random_start_frame else 0
@@ -107,6 +150,39 @@ class AnimationToken:
 
         self.next = initial_time + self._durations[self.index] + jitter_offset
 
+    def replace_images(self, images: Mapping[Surface, Surface]) -> None:
+        """
+        Swap frame images for their replacements, e.g. converted copies.
+
+        Timing and the current frame are kept. Frames whose image is not
+        in the mapping are left alone.
+
+        Args:
+            images: Mapping of old image to new image.
+        """
+        self.frames = tuple(
+            replace(frame, image=images.get(frame.image, frame.image))
+            for frame in self.frames
+        )
+
+    @property
+    def loop(self) -> bool:
+        return self._loop
+
+    @loop.setter
+    def loop(self, value: bool) -> None:
+        self._loop = value
+        self._rebuild_transitions()
+
+    @property
+    def ping_pong(self) -> bool:
+        return self._ping_pong
+
+    @ping_pong.setter
+    def ping_pong(self, value: bool) -> None:
+        self._ping_pong = value
+        self._rebuild_transitions()
+
     @property
     def current_frame(self) -> AnimationFrame:
         return self.frames[self.index]
@@ -126,40 +202,18 @@ class AnimationToken:
         Advances to the next frame, handling looping and ping-pong behavior.
         """
         if self.done:
-            return self.current_frame
-
-        if self.ping_pong:
-            at_end = self.index == len(self.frames) - 1 and self.direction == 1
-            at_start = self.index == 0 and self.direction == -1
-
-            if at_end:
-                self.direction = -1
-            elif at_start:
-                if not self.loop:
-                    self._finish()
-                    return self.current_frame
-                self.direction = 1
-
-            self.index += self.direction
-            self._clamp_index()
-
-            if not self.loop and self.index == 0 and self.direction == -1:
-                self._finish()
-                return self.current_frame
-
-        else:
-            if self.index == len(self.frames) - 1:
-                if self.loop:
-                    self.index = 0
-                else:
-                    self._finish()
-                    return self.current_frame
-            else:
-                self.index += 1
-                self._clamp_index()
-
-        self.next = current_time + self._durations[self.index]
-        return self.current_frame
+            return self.frames[self.index]
+
+        index, direction, finished = self._transitions[self.direction][self.index]
+        self.index = index
+        self.direction = direction
+
+        if finished:
+            self._finish()
+            return self.frames[index]
+
+        self.next = current_time + self._durations[index]
+        return self.frames[index]
 
     def update(
         self, current_time: TimeLike, elapsed_time: TimeLike | None = None
@@ -168,11 +222,23 @@ class AnimationToken:
         Advances through as many frames as needed to catch up to current_time.
         `elapsed_time` is accepted for backward compatibility but unused.
         """
-        if self.done:
-            return self.current_frame
+        # Fast path: nothing is due yet, which is the case on most frames
+        if self.done or current_time < self.next:
+            return self.frames[self.index]
 
-        # Safety limit: max 4 full cycles
+        # Cap on stepping so very short durations cannot spin forever
         max_steps = len(self.frames) * 4
+
+        # Plain loops repeat with a fixed period, so skip whole cycles in one
+        # step. The last cycle is still stepped through frame by frame rather
+        # than trusting the float floor division right at a cycle boundary
+        if self._loop and not self._ping_pong and self._period > 0:
+            cycles = (current_time - self.next) // self._period
+            if cycles > 1:
+                self.next += (cycles - 1) * self._period
+            # Less than two cycles remain after the skip
+            max_steps = len(self.frames) * 2 + 1
+
         steps = 0
 
         while current_time >= self.next:
@@ -181,7 +247,7 @@ class AnimationToken:
             if steps > max_steps:
                 break
 
-        return self.current_frame
+        return self.frames[self.index]
 
     def reset(self, current_time: float = 0.0) -> None:
         """
@@ -193,25 +259,26 @@ class AnimationToken:
         self._completed = False
         self.next = current_time + self._durations[0]
 
+    def _rebuild_transitions(self) -> None:
+        self._transitions = _build_transitions(
+            self._last_index, self._loop, self._ping_pong
+        )
+
     def _finish(self) -> None:
         self.done = True
         if not self._completed and self.on_complete is not None:
             self._completed = True
             self.on_complete(self)
 
-    def _clamp_index(self) -> None:
-        if self.index < 0:
-            self.index = 0
-        elif self.index >= len(self.frames):
-            self.index = len(self.frames) - 1
-
     def __lt__(self, other: AnimationToken | float | int) -> bool:
         """
         Required for heap ordering.
         """
+        # Token-to-token is the heap's hot case; the isinstance check is
+        # cheaper there than a getattr fallback
         if isinstance(other, AnimationToken):
             return self.next < other.next
-        return self.next < float(other)
+        return self.next < other
 
     def __repr__(self) -> str:
         return (
@@ -20,6 +20,7 @@ class CameraManager:
         self.next_cam: BaseCamera | None = None
         self.transition_time: float = 0.0
         self.transition_duration: float = 0.0
+        self._inv_duration: float = 0.0
         self._last_position: tuple[float, float] | None = None
 
     @property
@@ -39,33 +40,36 @@ class CameraManager:
 
         self.next_cam = cam
         self.transition_duration = duration
+        self._inv_duration = 1.0 / duration
         self.transition_time = 0.0
 
     def update(
         self, current_view: Rect, target_rect: Rect, dt: float
     ) -> tuple[float, float]:
-        if not self.next_cam:
+        next_cam = self.next_cam
+        if next_cam is None:
             pos = self.current.update(current_view, target_rect, dt)
             self._last_position = pos
             return pos
 
         # Update both cameras to keep internal state in sync
         ax, ay = self.current.update(current_view, target_rect, dt)
-        bx, by = self.next_cam.update(current_view, target_rect, dt)
+        bx, by = next_cam.update(current_view, target_rect, dt)
 
         self.transition_time += dt
-        t = min(self.transition_time / self.transition_duration, 1.0)
-
-        # smoothstep
-        t_smooth = t * t * (3.0 - 2.0 * t)
-
-        # tuple interpolation is faster than Vector2.lerp on your system
-        x = ax + (bx - ax) * t_smooth
-        y = ay + (by - ay) * t_smooth
-
+        t = self.transition_time * self._inv_duration
         if t >= 1.0:
-            self.current = self.next_cam
+            # finished: land exactly on the new camera and hand over to it
+            x, y = bx, by
+            self.current = next_cam
             self.next_cam = None
+        else:
+            # smoothstep
+            t = t * t * (3.0 - 2.0 * t)
+
+            # tuple interpolation is faster than Vector2.lerp on your system
+            x = ax + (bx - ax) * t
+            y = ay + (by - ay) * t
 
         result = (x, y)
         self._last_position = result
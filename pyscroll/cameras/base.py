@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import math
 import random
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
-from pygame.math import Vector2
-
 if TYPE_CHECKING:
     from pygame.rect import Rect
 
+_exp = math.exp
+_random = random.random
+
 
 class BaseCamera(ABC):
     def __init__(self, lerp_factor: float = 1.0, deadzone: Rect | None = None):
@@ -16,16 +18,43 @@ class BaseCamera(ABC):
         self.deadzone = deadzone
         self._shake_amount: float = 0.0
 
+    @property
+    def lerp_factor(self) -> float:
+        return self._lerp_factor
+
+    @lerp_factor.setter
+    def lerp_factor(self, value: float) -> None:
+        self._lerp_factor = value
+        self._snap = value >= 1.0
+        # 1 - (1 - f) ** dt == 1 - exp(-k * dt) with k = -ln(1 - f)
+        self._decay_k = math.inf if self._snap else -math.log(1.0 - value)
+
+    def _smoothing(self, dt: float) -> float:
+        """
+        Frame-rate independent lerp weight for a step of dt seconds, always
+        within [0, 1] so callers need no extra clamp.
+
+        Paused frames (dt <= 0) hold still and snap cameras jump straight to
+        the target, so neither needs the exponential.
+        """
+        if dt <= 0.0:
+            return 0.0
+        if self._snap:
+            return 1.0
+        return 1.0 - _exp(-self._decay_k * dt)
+
     def shake(self, intensity: float) -> None:
         self._shake_amount = min(self._shake_amount + intensity, 100.0)
 
     def _apply_shake(self, x: float, y: float) -> tuple[float, float]:
-        if self._shake_amount > 0.0:
-            ox = random.uniform(-self._shake_amount, self._shake_amount)
-            oy = random.uniform(-self._shake_amount, self._shake_amount)
-            self._shake_amount = max(0.0, self._shake_amount - 1.0)
-            v = Vector2(x + ox, y + oy)
-            return v.x, v.y
+        shake = self._shake_amount
+        if shake > 0.0:
+            # same draw as random.uniform(-shake, shake), minus its Python frame
+            span = shake + shake
+            ox = _random() * span - shake
+            oy = _random() * span - shake
+            self._shake_amount = max(0.0, shake - 1.0)
+            return float(x + ox), float(y + oy)
         return float(x), float(y)
 
     @abstractmethod
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import math
 from typing import TYPE_CHECKING
 
-from pygame.math import Vector2
-
 from .base import BaseCamera
 
 if TYPE_CHECKING:
@@ -29,11 +26,14 @@ class BasicCamera(BaseCamera):
         Returns:
             A tuple (x, y) representing the new camera center.
         """
-        t: float = 1.0 - math.pow(1.0 - self.lerp_factor, dt)
-
-        current: Vector2 = Vector2(current_view.center)
-        target: Vector2 = Vector2(target_rect.center)
+        # exponential smoothing weight, already within [0, 1]
+        t: float = self._smoothing(dt)
 
-        new_pos: Vector2 = current.lerp(target, min(1.0, t))
+        cx: float
+        cy: float
+        tx: float
+        ty: float
+        cx, cy = current_view.center
+        tx, ty = target_rect.center
 
-        return self._apply_shake(new_pos.x, new_pos.y)
+        return self._apply_shake(cx + (tx - cx) * t, cy + (ty - cy) * t)
@@ -23,6 +23,7 @@ class BoundsCamera(BaseCamera):
         self.clamp_shake: bool = clamp_shake
 
     def shake(self, intensity: float) -> None:
+        """Forward shake to the underlying base camera."""
         self.base.shake(intensity)
 
     def update(
@@ -44,26 +45,27 @@ class BoundsCamera(BaseCamera):
         """
         x, y = self.base.update(current_view, target_rect, dt)
 
-        half_w: int = current_view.width // 2
-        half_h: int = current_view.height // 2
-
         if self.clamp_shake:
+            world = self.world_rect
+            view_w: int = current_view.width
+            view_h: int = current_view.height
+            half_w: int = view_w // 2
+            half_h: int = view_h // 2
+
             # Horizontal clamp
-            if current_view.width > self.world_rect.width:
-                x = float(self.world_rect.centerx)
+            if view_w > world.width:
+                x = float(world.centerx)
             else:
-                x = max(
-                    self.world_rect.left + half_w,
-                    min(self.world_rect.right - half_w, x),
-                )
+                lo = world.left + half_w
+                hi = world.right - half_w
+                x = lo if x < lo else hi if x > hi else x
 
             # Vertical clamp
-            if current_view.height > self.world_rect.height:
-                y = float(self.world_rect.centery)
+            if view_h > world.height:
+                y = float(world.centery)
             else:
-                y = max(
-                    self.world_rect.top + half_h,
-                    min(self.world_rect.bottom - half_h, y),
-                )
+                lo = world.top + half_h
+                hi = world.bottom - half_h
+                y = lo if y < lo else hi if y > hi else y
 
         return float(x), float(y)
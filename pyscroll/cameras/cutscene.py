@@ -27,6 +27,11 @@ class CutsceneCamera(BaseCamera):
             raise ValueError("interpolation must be 'linear' or 'catmull_rom'")
 
         self.waypoints: list[Vector2] = [Vector2(w) for w in waypoints]
+        # copy of the waypoints the cached path below was built from
+        self._path: list[Vector2] = []
+        self._segments: list[tuple[float, float, float, float]] = []
+        # Catmull-Rom polynomial coefficients, built lazily per loop mode
+        self._splines: dict[bool, list[tuple[float, ...]]] = {}
         self.duration: float = duration
         self.loop: bool = loop
         self.time: float = 0.0
@@ -34,6 +39,24 @@ class CutsceneCamera(BaseCamera):
         self._completed: bool = False
         self.interpolation: str = interpolation
 
+    def _sync_path(self) -> None:
+        """
+        Rebuild the cached path if the waypoints changed since it was built.
+
+        The waypoints list is public and may be replaced or edited in place,
+        so it is compared against a copy; Vector2 equality runs in C and
+        does not allocate.
+        """
+        if self._path == self.waypoints:
+            return
+        points = self._path = [Vector2(w) for w in self.waypoints]
+        # Per-segment (x0, y0, dx, dy), so linear interpolation is two
+        # multiply-adds on floats instead of a Vector2.lerp per frame
+        self._segments = [
+            (a.x, a.y, b.x - a.x, b.y - a.y) for a, b in zip(points, points[1:])
+        ]
+        self._splines = {}
+
     @staticmethod
     def _catmull_rom(
         p0: tuple[float, float] | Vector2,
@@ -53,47 +76,53 @@ class CutsceneCamera(BaseCamera):
         )
         return r.x, r.y
 
-    @staticmethod
-    def _catmull_rom_vec(
-        v0: Vector2,
-        v1: Vector2,
-        v2: Vector2,
-        v3: Vector2,
-        t: float,
-    ) -> Vector2:
-        t2: float = t * t
-        t3: float = t2 * t
-        return 0.5 * (
-            (2 * v1)
-            + (-v0 + v2) * t
-            + (2 * v0 - 5 * v1 + 4 * v2 - v3) * t2
-            + (-v0 + 3 * v1 - 3 * v2 + v3) * t3
-        )
-
     def _get_control_points(
         self,
         seg: int,
     ) -> tuple[Vector2, Vector2, Vector2, Vector2]:
-        n: int = len(self.waypoints)
+        n: int = len(self._path)
         if self.loop:
             return (
-                self.waypoints[(seg - 1) % n],
-                self.waypoints[seg % n],
-                self.waypoints[(seg + 1) % n],
-                self.waypoints[(seg + 2) % n],
+                self._path[(seg - 1) % n],
+                self._path[seg % n],
+                self._path[(seg + 1) % n],
+                self._path[(seg + 2) % n],
             )
         return (
-            self.waypoints[max(seg - 1, 0)],
-            self.waypoints[seg],
-            self.waypoints[min(seg + 1, n - 1)],
-            self.waypoints[min(seg + 2, n - 1)],
+            self._path[max(seg - 1, 0)],
+            self._path[seg],
+            self._path[min(seg + 1, n - 1)],
+            self._path[min(seg + 2, n - 1)],
         )
 
-    def _interpolate(self, seg: int, local_t: float) -> Vector2:
+    def _spline_coefficients(self) -> list[tuple[float, ...]]:
+        """
+        Expand every segment's Catmull-Rom polynomial into power-basis
+        coefficients (a, b, c, d) per axis, evaluated as a + t(b + t(c + td)).
+        """
+        splines = self._splines.get(self.loop)
+        if splines is None:
+            splines = []
+            for seg in range(len(self._segments)):
+                v0, v1, v2, v3 = self._get_control_points(seg)
+                a = v1
+                b = 0.5 * (v2 - v0)
+                c = 0.5 * (2 * v0 - 5 * v1 + 4 * v2 - v3)
+                d = 0.5 * (-v0 + 3 * v1 - 3 * v2 + v3)
+                splines.append((a.x, b.x, c.x, d.x, a.y, b.y, c.y, d.y))
+            self._splines[self.loop] = splines
+        return splines
+
+    def _interpolate(self, seg: int, local_t: float) -> tuple[float, float]:
         if self.interpolation == "catmull_rom":
-            v0, v1, v2, v3 = self._get_control_points(seg)
-            return self._catmull_rom_vec(v0, v1, v2, v3, local_t)
-        return self.waypoints[seg].lerp(self.waypoints[seg + 1], local_t)
+            ax, bx, cx, dx, ay, by, cy, dy = self._spline_coefficients()[seg]
+            t = local_t
+            return (
+                ax + t * (bx + t * (cx + t * dx)),
+                ay + t * (by + t * (cy + t * dy)),
+            )
+        x0, y0, dx, dy = self._segments[seg]
+        return x0 + dx * local_t, y0 + dy * local_t
 
     def update(
         self,
@@ -101,8 +130,9 @@ class CutsceneCamera(BaseCamera):
         target_rect: Rect,
         dt: float,
     ) -> tuple[float, float]:
-        if len(self.waypoints) == 1:
-            wp: Vector2 = self.waypoints[0]
+        self._sync_path()
+        if len(self._path) == 1:
+            wp: Vector2 = self._path[0]
             return self._apply_shake(wp.x, wp.y)
 
         # End of non-looping cutscene
@@ -110,7 +140,7 @@ class CutsceneCamera(BaseCamera):
             if not self._completed and self.on_complete is not None:
                 self._completed = True
                 self.on_complete()
-            wp = self.waypoints[-1]
+            wp = self._path[-1]
             return self._apply_shake(wp.x, wp.y)
 
         # Advance time
@@ -126,15 +156,15 @@ class CutsceneCamera(BaseCamera):
                 if not self._completed and self.on_complete is not None:
                     self._completed = True
                     self.on_complete()
-                wp = self.waypoints[-1]
+                wp = self._path[-1]
                 return self._apply_shake(wp.x, wp.y)
 
-        seg_count: int = len(self.waypoints) - 1
+        seg_count: int = len(self._segments)
         seg: int = min(int(t * seg_count), seg_count - 1)
         local_t: float = (t * seg_count) - seg
 
-        pos: Vector2 = self._interpolate(seg, local_t)
-        return self._apply_shake(pos.x, pos.y)
+        x, y = self._interpolate(seg, local_t)
+        return self._apply_shake(x, y)
 
     def reset(self) -> None:
         self.time = 0.0
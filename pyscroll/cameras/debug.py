@@ -15,7 +15,13 @@ class DebugFlyCamera(BaseCamera):
         super().__init__(1.0)
         self.pos: Vector2 | None = None
         self.speed: float = speed
-        self.move: Vector2 = Vector2(0.0, 0.0)
+        self.move_x: float = 0.0
+        self.move_y: float = 0.0
+
+    @property
+    def move(self) -> Vector2:
+        """Current movement direction, as set by set_input."""
+        return Vector2(self.move_x, self.move_y)
 
     def set_position(self, x: float, y: float) -> None:
         """Teleport the camera to a specific position."""
@@ -23,7 +29,8 @@ class DebugFlyCamera(BaseCamera):
 
     def set_input(self, dx: float, dy: float) -> None:
         """Set movement direction (normalized or raw)."""
-        self.move.xy = Vector2(dx, dy)
+        self.move_x = dx
+        self.move_y = dy
 
     def update(
         self,
@@ -42,9 +49,12 @@ class DebugFlyCamera(BaseCamera):
         Returns:
             A tuple (x, y) representing the new camera center.
         """
-        if self.pos is None:
-            self.pos = Vector2(current_view.center)
+        pos = self.pos
+        if pos is None:
+            pos = self.pos = Vector2(current_view.center)
 
-        self.pos += self.move * self.speed * dt
+        step = self.speed * dt
+        pos.x += self.move_x * step
+        pos.y += self.move_y * step
 
-        return self._apply_shake(self.pos.x, self.pos.y)
+        return self._apply_shake(pos.x, pos.y)
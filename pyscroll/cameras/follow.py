@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import math
 from typing import TYPE_CHECKING
 
-from pygame.math import Vector2
-
 from .base import BaseCamera
 
 if TYPE_CHECKING:
@@ -29,17 +26,35 @@ class FollowCamera(BaseCamera):
         Returns:
             A tuple (x, y) representing the new camera center.
         """
-        current: Vector2 = Vector2(current_view.center)
-        target: Vector2 = Vector2(target_rect.center)
-
-        # Deadzone logic
-        if self.deadzone is not None:
-            self.deadzone.center = current_view.center
-            if self.deadzone.contains(target_rect):
-                return self._apply_shake(current.x, current.y)
-
-        # Exponential smoothing
-        t: float = 1.0 - math.pow(1.0 - self.lerp_factor, dt)
-        new_pos: Vector2 = current.lerp(target, min(1.0, t))
-
-        return self._apply_shake(new_pos.x, new_pos.y)
+        cx: float
+        cy: float
+        cx, cy = current_view.center
+
+        # Deadzone logic: Rect.contains for the deadzone centered on the
+        # view, unrolled so the deadzone Rect is neither moved nor copied
+        deadzone = self.deadzone
+        if deadzone is not None:
+            dw, dh = deadzone.size
+            left = cx - dw // 2
+            top = cy - dh // 2
+            right = left + dw
+            bottom = top + dh
+            tl, tt, tw, th = target_rect
+            if (
+                left <= tl
+                and top <= tt
+                and tl + tw <= right
+                and tt + th <= bottom
+                and tl < right
+                and tt < bottom
+            ):
+                return self._apply_shake(cx, cy)
+
+        tx: float
+        ty: float
+        tx, ty = target_rect.center
+
+        # Exponential smoothing; the weight is already within [0, 1]
+        t: float = self._smoothing(dt)
+
+        return self._apply_shake(cx + (tx - cx) * t, cy + (ty - cy) * t)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import math
 from typing import TYPE_CHECKING
 
 from .base import BaseCamera
@@ -38,7 +37,7 @@ class PlatformerCamera(BaseCamera):
         tx, ty = target_rect.center
 
         # Exponential smoothing
-        t: float = 1.0 - math.pow(1.0 - self.lerp_factor, dt)
+        t: float = self._smoothing(dt)
 
         # Horizontal follow always active
         new_x: float = cx + (tx - cx) * t
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import math
 from typing import TYPE_CHECKING
 
 from pygame.math import Vector2
@@ -90,7 +89,7 @@ class RailCamera(BaseCamera):
         target: Vector2 = Vector2(target_rect.center)
         rail_target: Vector2 = self._closest_point_on_rail(target)
 
-        t: float = 1.0 - math.pow(1.0 - self.lerp_factor, dt)
-        new_pos: Vector2 = Vector2(cx, cy).lerp(rail_target, min(1.0, t))
+        t: float = self._smoothing(dt)
+        new_pos: Vector2 = Vector2(cx, cy).lerp(rail_target, t)
 
         return self._apply_shake(new_pos.x, new_pos.y)
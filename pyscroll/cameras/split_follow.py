@@ -62,19 +62,19 @@ class SplitFollowCamera(BaseCamera):
         cy: float
         cx, cy = current_view.center
 
-        t: float = 1.0 - math.pow(1.0 - self.lerp_factor, dt)
+        t: float = self._smoothing(dt)
 
         # Single-target or fallback mode
         if not self.targets or len(self.targets) == 1:
             target: Vector2 = Vector2(
                 self.targets[0].center if self.targets else target_rect.center
             )
-            new_pos: Vector2 = Vector2(cx, cy).lerp(target, min(1.0, t))
+            new_pos: Vector2 = Vector2(cx, cy).lerp(target, t)
             return self._apply_shake(new_pos.x, new_pos.y)
 
         # Multi-target midpoint follow
         midpoint: Vector2 = self._get_midpoint()
-        new_pos = Vector2(cx, cy).lerp(midpoint, min(1.0, t))
+        new_pos = Vector2(cx, cy).lerp(midpoint, t)
 
         # Dynamic zoom based on separation
         sep: float = self._get_max_separation()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 from .base import BaseCamera
@@ -9,6 +10,8 @@ if TYPE_CHECKING:
 
     from pyscroll.cameras.base import BaseCamera as _BaseCamera
 
+_exp = math.exp
+
 
 class ZoomCamera(BaseCamera):
     def __init__(
@@ -40,6 +43,9 @@ class ZoomCamera(BaseCamera):
         """
         Update zoom smoothly while delegating position to the base camera.
 
+        Zoom eases toward target_zoom by exponential decay, with zoom_speed
+        as the rate per second, so the approach is the same at any frame rate.
+
         Args:
             current_view: The current viewport rectangle.
             target_rect: The target object rectangle.
@@ -50,10 +56,14 @@ class ZoomCamera(BaseCamera):
         """
         x, y = self.base.update(current_view, target_rect, dt)
 
-        diff: float = self.target_zoom - self.zoom
-        self.zoom = max(
-            0.1,
-            self.zoom + diff * min(1.0, dt * self.zoom_speed),
-        )
+        zoom: float = self.zoom
+        target: float = self.target_zoom
+        if zoom != target:
+            if abs(target - zoom) < 1e-6:
+                # settle exactly instead of creeping toward the target forever
+                self.zoom = target
+            else:
+                zoom = target + (zoom - target) * _exp(-self.zoom_speed * dt)
+                self.zoom = zoom if zoom > 0.1 else 0.1
 
         return float(x), float(y)
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
 from pygame.math import Vector2
 from pygame.rect import Rect
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable, Sequence
+    from collections.abc import Iterable, Sequence
 
     from pygame.surface import Surface
 
@@ -17,14 +16,30 @@ ColorRGB = tuple[int, int, int]
 ColorRGBA = tuple[int, int, int, int]
 
 
-@contextmanager
-def surface_clipping_context(
-    surface: Surface, clip: RectLike
-) -> Generator[None, Any, None]:
-    original = surface.get_clip()
-    surface.set_clip(clip)
-    yield
-    surface.set_clip(original)
+class _SurfaceClip:
+    """
+    Set a surface's clip on enter and restore the previous one on exit.
+
+    A plain class is cheaper than a @contextmanager generator, which matters
+    because the renderers enter one on every draw.
+    """
+
+    __slots__ = ("surface", "clip", "original")
+
+    def __init__(self, surface: Surface, clip: RectLike) -> None:
+        self.surface = surface
+        self.clip = clip
+
+    def __enter__(self) -> None:
+        self.original = self.surface.get_clip()
+        self.surface.set_clip(self.clip)
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.surface.set_clip(self.original)
+
+
+def surface_clipping_context(surface: Surface, clip: RectLike) -> _SurfaceClip:
+    return _SurfaceClip(surface, clip)
 
 
 def rect_difference(a: RectLike, b: RectLike) -> list[Rect]:
@@ -35,34 +50,41 @@ def rect_difference(a: RectLike, b: RectLike) -> list[Rect]:
     ra = Rect(a) if not isinstance(a, Rect) else a
     rb = Rect(b) if not isinstance(b, Rect) else b
 
+    # disjoint rects are the common case; skip allocating an empty clip
+    if not ra.colliderect(rb):
+        return [ra]
+
     inter = ra.clip(rb)
     if inter.width == 0 or inter.height == 0:
         return [ra]
 
+    ix, iy, iw, ih = inter
+    ax, ay, aw, ah = ra
+    ar = ax + aw
+    ab = ay + ah
+    ir = ix + iw
+    ib = iy + ih
+
     result: list[Rect] = []
 
-    if inter.top > ra.top:
-        result.append(Rect(ra.left, ra.top, ra.width, inter.top - ra.top))
+    if iy > ay:
+        result.append(Rect(ax, ay, aw, iy - ay))
 
-    if inter.bottom < ra.bottom:
-        result.append(Rect(ra.left, inter.bottom, ra.width, ra.bottom - inter.bottom))
+    if ib < ab:
+        result.append(Rect(ax, ib, aw, ab - ib))
 
-    if inter.left > ra.left:
-        result.append(Rect(ra.left, inter.top, inter.left - ra.left, inter.height))
+    if ix > ax:
+        result.append(Rect(ax, iy, ix - ax, ih))
 
-    if inter.right < ra.right:
-        result.append(
-            Rect(inter.right, inter.top, ra.right - inter.right, inter.height)
-        )
+    if ir < ar:
+        result.append(Rect(ir, iy, ar - ir, ih))
 
     return result
 
 
 def rect_to_bb(rect: RectLike) -> tuple[int, int, int, int]:
-    if isinstance(rect, Rect):
-        x, y, w, h = rect.x, rect.y, rect.width, rect.height
-    else:
-        x, y, w, h = rect
+    # Rect unpacks like a 4-tuple, so one path serves both
+    x, y, w, h = rect
     return x, y, x + w - 1, y + h - 1
 
 
@@ -72,12 +94,11 @@ def vector3_to_iso(
     """
     Convert 3D cartesian coordinates to isometric coordinates.
     """
-    if not isinstance(vector3, tuple) or len(vector3) != 3:
-        raise ValueError("Input tuple must have exactly 3 elements")
-    return (
-        (vector3[0] - vector3[1]) + offset[0],
-        ((vector3[0] + vector3[1]) >> 1) - vector3[2] + offset[1],
-    )
+    try:
+        x, y, z = vector3
+    except (TypeError, ValueError):
+        raise ValueError("Input tuple must have exactly 3 elements") from None
+    return (x - y) + offset[0], ((x + y) >> 1) - z + offset[1]
 
 
 def vector2_to_iso(
@@ -86,18 +107,39 @@ def vector2_to_iso(
     """
     Convert 2D cartesian coordinates to isometric coordinates.
     """
-    if not isinstance(vector2, tuple) or len(vector2) != 2:
-        raise ValueError("Input tuple must have exactly 2 elements")
-    return (
-        (vector2[0] - vector2[1]) + offset[0],
-        ((vector2[0] + vector2[1]) >> 1) + offset[1],
-    )
+    try:
+        x, y = vector2
+    except (TypeError, ValueError):
+        raise ValueError("Input tuple must have exactly 2 elements") from None
+    return (x - y) + offset[0], ((x + y) >> 1) + offset[1]
+
+
+def vector3_to_iso_batch(
+    vectors: Iterable[tuple[int, int, int]], offset: tuple[int, int] = (0, 0)
+) -> list[tuple[int, int]]:
+    """
+    Convert many 3D cartesian coordinates to isometric coordinates at once.
+    """
+    ox, oy = offset
+    return [(x - y + ox, ((x + y) >> 1) - z + oy) for x, y, z in vectors]
+
+
+def vector2_to_iso_batch(
+    vectors: Iterable[tuple[int, int]], offset: tuple[int, int] = (0, 0)
+) -> list[tuple[int, int]]:
+    """
+    Convert many 2D cartesian coordinates to isometric coordinates at once.
+    """
+    ox, oy = offset
+    return [(x - y + ox, ((x + y) >> 1) + oy) for x, y in vectors]
 
 
 T = TypeVar("T")
 
 
 def rev(seq: Sequence[T], start: int, stop: int) -> Iterable[tuple[int, T]]:
+    # A list slice is a single memcpy; islice would walk past the first
+    # `start` items one by one and measures slower on tile rows
     if start < 0:
         start = 0
     return enumerate(seq[start : stop + 1], start)
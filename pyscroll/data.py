@@ -10,7 +10,8 @@ from __future__ import annotations
 import time
 from abc import ABC, abstractmethod
 from contextlib import suppress
-from heapq import heappop, heappush
+from heapq import heapify, heapreplace
+from itertools import compress
 from typing import TYPE_CHECKING, Any
 
 import pygame
@@ -86,6 +87,14 @@ class PyscrollDataAdapter(ABC):
         """Reload underlying map data."""
         ...
 
+    def invalidate_layer_cache(self) -> None:
+        """
+        Forget cached layer information.
+
+        Call this after changing which layers are visible, then redraw.
+        """
+        pass
+
     @abstractmethod
     def _get_tile_image(self, x: int, y: int, layer: int) -> Surface | None:
         """Return tile image at coordinates, or None if empty."""
@@ -109,6 +118,22 @@ class PyscrollDataAdapter(ABC):
     def convert_surfaces(self, surface: Surface, alpha: bool) -> None:
         pass
 
+    def _replace_animation_images(self, converted: dict[Surface, Surface]) -> None:
+        """
+        Point animation frames and animated tiles at converted surfaces.
+
+        Tokens are built by reload_animations, usually before the renderer
+        converts the tile images, so they would keep the originals.
+
+        Args:
+            converted: Mapping of original image to converted image
+        """
+        for token in self._animation_queue:
+            token.replace_images(converted)
+        at = self._animated_tile
+        for position, image in at.items():
+            at[position] = converted.get(image, image)
+
     def pixel_to_tile(self, px: float, py: float) -> tuple[int, int]:
         """
         Translates pixel coordinates (float) to map tile coordinates (int).
@@ -145,37 +170,54 @@ class PyscrollDataAdapter(ABC):
         except IndexError:
             return new_tiles
 
-        tile_layers = tuple(self.visible_tile_layers)
+        tile_layers = self.visible_tile_layers
 
-        # test if the next scheduled tile change is ready
-        while self._animation_queue[0].next <= self._last_time:
-            # get the next tile/frame which is ready to be changed
-            token = heappop(self._animation_queue)
-            next_frame = token.advance(self._last_time)
-            heappush(self._animation_queue, token)
+        queue = self._animation_queue
 
-            # following line for when all gid positions are known
-            # for position in token.positions:
+        # view bounds as plain ints; comparing them inline is cheaper than a
+        # collidepoint call for every tracked position
+        vx, vy, vw, vh = tile_view
+        vr = vx + vw
+        vb = vy + vh
+        at = self._animated_tile
+        get_tile_image = self.get_tile_image
 
-            for position in token.positions.copy():
+        # test if the next scheduled tile change is ready
+        while queue[0].next <= self._last_time:
+            # advance the token at the root in place, then restore heap order
+            # with a single sift instead of a pop followed by a push
+            token = queue[0]
+            next_frame = token.advance(self._last_time)
+            heapreplace(queue, token)
+
+            positions = token.positions
+            on_screen = [p for p in positions if vx <= p[0] < vr and vy <= p[1] < vb]
+            if len(on_screen) != len(positions):
+                # prune positions that left the view, so a token only ever
+                # holds about one view's worth. dropping the cached frame
+                # makes the tile register again when it is drawn next
+                for position in positions.difference(on_screen):
+                    at.pop(position, None)
+                positions.intersection_update(on_screen)
+
+            # the list is a snapshot: get_tile_image may add positions
+            frame_image = next_frame.image
+            for position in on_screen:
                 x, y, layer = position  # actual tile layer
-
-                if tile_view.collidepoint(x, y):
-                    self._animated_tile[position] = next_frame.image
-
-                    # redraw the entire column of tiles
-                    for tile_layer in tile_layers:  # renamed variable
-                        if tile_layer == layer:
-                            # queue the new animated tile
-                            new_tiles.append((x, y, tile_layer, next_frame.image))
-                        else:
-                            # queue the normal tile
-                            image = self.get_tile_image(x, y, tile_layer)
-                            if image:
-                                new_tiles.append((x, y, tile_layer, image))
-                else:
-                    # keep position; skip drawing when off-screen
-                    continue
+                at[position] = frame_image
+
+                # redraw the entire column of tiles: the buffer holds all
+                # layers composited together, so the new frame alone would
+                # cover the layers above it and blend over the old frame
+                for tile_layer in tile_layers:  # renamed variable
+                    if tile_layer == layer:
+                        # queue the new animated tile
+                        new_tiles.append((x, y, tile_layer, frame_image))
+                    else:
+                        # queue the normal tile
+                        image = get_tile_image(x, y, tile_layer)
+                        if image:
+                            new_tiles.append((x, y, tile_layer, image))
 
         return new_tiles
 
@@ -183,7 +225,7 @@ class PyscrollDataAdapter(ABC):
         if self._is_paused:
             return
 
-        current_time = time.time()
+        current_time = time.monotonic()
         if self._pause_mode_skip_ahead and self._paused_time > 0.0:
             self._last_time += current_time - self._paused_time
             self._paused_time = 0.0
@@ -235,7 +277,10 @@ class PyscrollDataAdapter(ABC):
             positions: set[tuple[int, int, int]] = set()
             ani = AnimationToken(positions, frames, self._last_time)
             self._animation_map[gid] = ani
-            heappush(self._animation_queue, ani)
+            self._animation_queue.append(ani)
+
+        # one linear heapify instead of a sift per token
+        heapify(self._animation_queue)
 
     def get_tile_image(self, x: int, y: int, layer: int) -> Surface | None:
         """
@@ -248,25 +293,23 @@ class PyscrollDataAdapter(ABC):
         """
         position: tuple[int, int, int] = (x, y, layer)
 
-        try:
-            return self._animated_tile[position]
-
-        except KeyError:
-            image = self._get_tile_image(x, y, layer)
-
-            if self._animation_map:
-                gid = self._get_tile_gid(x, y, layer)
-                if gid in self._animation_map:
-                    token = self._animation_map[gid]
-                    token.positions.add(position)
-
-                    self._animated_tile[position] = token.frames[0].image
-                    return self._animated_tile[position]
+        image = self._animated_tile.get(position)
+        if image is not None:
+            return image
 
-                return image
+        image = self._get_tile_image(x, y, layer)
+        animation_map = self._animation_map
+        if not animation_map:
+            return image
 
+        token = animation_map.get(self._get_tile_gid(x, y, layer))
+        if token is None:
             return image
 
+        token.positions.add(position)
+        image = self._animated_tile[position] = token.frames[0].image
+        return image
+
     def get_tile_images_by_rect(
         self, view: RectLike
     ) -> Iterable[tuple[int, int, int, Surface]]:
@@ -291,10 +334,14 @@ class PyscrollDataAdapter(ABC):
             view: Rect-like object that defines tiles to draw
         """
         x1, y1, x2, y2 = rect_to_bb(view)
+        get_tile_image = self.get_tile_image
+        xs = range(x1, x2 + 1)
+        ys = range(y1, y2 + 1)
+
         for layer in self.visible_tile_layers:
-            for x in range(x1, x2 + 1):
-                for y in range(y1, y2 + 1):
-                    tile = self.get_tile_image(x, y, layer)
+            for x in xs:
+                for y in ys:
+                    tile = get_tile_image(x, y, layer)
                     if tile:
                         yield x, y, layer, tile
 
@@ -304,7 +351,7 @@ class PyscrollDataAdapter(ABC):
         """
         if not self._is_paused:
             self._is_paused = True
-            self._paused_time = time.time()
+            self._paused_time = time.monotonic()
 
     def resume_animations(self) -> None:
         """
@@ -338,8 +385,21 @@ class TiledMapData(PyscrollDataAdapter):
         super().__init__()
         self.tmx = tmx
         self._tracked_gids: set[int] = set()
+        self._cache_map_info()
         self.reload_animations()
 
+    def _cache_map_info(self) -> None:
+        """
+        Cache map values that are read every frame.
+
+        The visible layer list is resolved lazily, so layer visibility
+        changes are picked up after invalidate_layer_cache or a reload.
+        """
+        tmx = self.tmx
+        self._tile_size = (tmx.tilewidth, tmx.tileheight)
+        self._map_size = (tmx.width, tmx.height)
+        self._visible_tile_layers: list[int] | None = None
+
     @property
     def tile_overdraw(self) -> tuple[int, int]:
         max_h = max(
@@ -350,6 +410,14 @@ class TiledMapData(PyscrollDataAdapter):
 
     def reload_data(self) -> None:
         self.tmx = pytmx.load_pygame(self.tmx.filename)
+        self._cache_map_info()
+
+    def invalidate_layer_cache(self) -> None:
+        self._visible_tile_layers = None
+
+    def reload_animations(self) -> None:
+        self.invalidate_layer_cache()
+        super().reload_animations()
 
     def get_animations(self) -> Iterable[tuple[int, list[tuple[int, int]]]]:
         for gid, d in self.tmx.tile_properties.items():
@@ -364,19 +432,37 @@ class TiledMapData(PyscrollDataAdapter):
                 images.append(i.convert_alpha() if alpha else i.convert(parent))
             except AttributeError:
                 images.append(None)
+
+        self._replace_animation_images(
+            {
+                old: new
+                for old, new in zip(self.tmx.images, images)
+                if old is not None and new is not None
+            }
+        )
         self.tmx.images = images
 
     @property
     def tile_size(self) -> tuple[int, int]:
-        return self.tmx.tilewidth, self.tmx.tileheight
+        return self._tile_size
 
     @property
     def map_size(self) -> tuple[int, int]:
-        return self.tmx.width, self.tmx.height
+        return self._map_size
 
     @property
     def visible_tile_layers(self) -> list[int]:
-        return self.tmx.visible_tile_layers
+        """
+        Indices of the visible tile layers, cached after the first read.
+
+        Changing a layer's ``visible`` flag at runtime has no effect until
+        invalidate_layer_cache is called or the map is reloaded. Tiles
+        already in the renderer's buffer change on its next full redraw.
+        """
+        layers = self._visible_tile_layers
+        if layers is None:
+            layers = self._visible_tile_layers = list(self.tmx.visible_tile_layers)
+        return layers
 
     @property
     def visible_object_layers(self) -> Iterable[pytmx.TiledObjectGroup]:
@@ -405,25 +491,32 @@ class TiledMapData(PyscrollDataAdapter):
         self, view: RectLike
     ) -> Iterable[tuple[int, int, int, Surface]]:
         x1, y1, x2, y2 = rect_to_bb(view)
+        if x1 < 0:
+            x1 = 0
+        x2 += 1
         images = self.tmx.images
         layers = self.tmx.layers
         at = self._animated_tile
         tracked_gids = self._tracked_gids
         anim_map = self._animation_map
-        track = bool(self._animation_queue)
 
-        for layer in self.tmx.visible_tile_layers:
+        for layer in self.visible_tile_layers:
             for y, row in rev(layers[layer].data, y1, y2):
-                for x, gid in [i for i in rev(row, x1, x2) if i[1]]:
-                    # since the tile has been queried, assume it wants
-                    # to be checked for animations sometime in the future
-                    if track and gid in tracked_gids:
-                        anim_map[gid].positions.add((x, y, layer))
-                    try:
-                        # animated, so return the correct frame
-                        tile = at[(x, y, layer)]
-                    except KeyError:
-                        # not animated, so return surface from data, if any
+                # compress drops the empty (zero) gids in C, so sparse
+                # layers only pay for the tiles they actually have
+                gids = row[x1:x2]
+                for x, gid in compress(enumerate(gids, x1), gids):
+                    if gid in tracked_gids:
+                        # since the tile has been queried, assume it wants
+                        # to be checked for animations sometime in the future
+                        position = (x, y, layer)
+                        anim_map[gid].positions.add(position)
+                        # animated tiles only exist for tracked gids, so
+                        # plain tiles never probe the animated tile dict
+                        tile = at.get(position)
+                        if tile is None:
+                            tile = images[gid]
+                    else:
                         tile = images[gid]
                     if tile:
                         yield x, y, layer, tile
@@ -441,12 +534,23 @@ class MapAggregator(PyscrollDataAdapter):
     - Dynamic map removal with re-normalization
     """
 
+    # world_to_local remembers this many tiles before starting over, so a
+    # long session on a large stitched world cannot grow the memo unbounded
+    _OWNERS_LIMIT: int = 16384
+
     def __init__(self, tile_size: tuple[int, int], normalize: bool = True) -> None:
         super().__init__()
         self._tile_size = tile_size
         self._normalize = normalize
         self._map_size: tuple[int, int] = (0, 0)
         self.maps: list[tuple[PyscrollDataAdapter, Rect, int]] = []
+        self._visible_tile_layers: list[int] | None = None
+        self._sorted_maps: list[tuple[PyscrollDataAdapter, Rect, int]] | None = None
+        self._sorted_rects: list[Rect] = []
+        # (x, y) -> maps covering that tile, topmost first, as (data, left, top, z)
+        self._owners: dict[
+            tuple[int, int], tuple[tuple[PyscrollDataAdapter, int, int, int], ...]
+        ] = {}
         self._min_x: int = 0
         self._min_y: int = 0
         self._animation_map: dict[int, AnimationToken] = {}
@@ -462,10 +566,13 @@ class MapAggregator(PyscrollDataAdapter):
 
     @property
     def visible_tile_layers(self) -> list[int]:
-        layers = set()
-        for data, _, z in self.maps:
-            layers.update([layer + z for layer in data.visible_tile_layers])
-        return sorted(layers)
+        cached = self._visible_tile_layers
+        if cached is None:
+            layers = set()
+            for data, _, z in self.maps:
+                layers.update([layer + z for layer in data.visible_tile_layers])
+            cached = self._visible_tile_layers = sorted(layers)
+        return cached
 
     def world_to_local(
         self, x: int, y: int, layer: int
@@ -474,13 +581,24 @@ class MapAggregator(PyscrollDataAdapter):
         Convert world coordinates (x, y, l) into the correct
         (data, local_x, local_y, local_layer) for the map that owns them.
         """
-        for data, rect, z in reversed(self.maps):  # check topmost first
-            if rect.collidepoint(x, y):
-                local_x = x - rect.left
-                local_y = y - rect.top
-                local_l = layer - z
-                if local_l in data.visible_tile_layers:
-                    return data, local_x, local_y, local_l
+        owners = self._owners.get((x, y))
+        if owners is None:
+            owners = tuple(
+                (data, rect.left, rect.top, z)
+                for data, rect, z in reversed(self.maps)  # check topmost first
+                if rect.collidepoint(x, y)
+            )
+            if not owners:
+                return None
+            # only tiles inside a map are remembered
+            if len(self._owners) >= self._OWNERS_LIMIT:
+                self._owners.clear()
+            self._owners[(x, y)] = owners
+
+        for data, left, top, z in owners:
+            local_l = layer - z
+            if local_l in data.visible_tile_layers:
+                return data, x - left, y - top, local_l
         return None
 
     def add_map(
@@ -491,6 +609,9 @@ class MapAggregator(PyscrollDataAdapter):
 
         rect = pygame.Rect(offset, data.map_size)
         self.maps.append((data, rect, layer))
+        self._visible_tile_layers = None
+        self._sorted_maps = None
+        self._owners.clear()
 
         # Only normalize if flag is set
         if self._normalize:
@@ -505,6 +626,9 @@ class MapAggregator(PyscrollDataAdapter):
         self.maps = [m for m in self.maps if m[0] != data]
         if len(self.maps) == initial_len:
             raise ValueError("Map is not in the aggregator")
+        self._visible_tile_layers = None
+        self._sorted_maps = None
+        self._owners.clear()
 
         if self._normalize:
             self._re_normalize_positions()
@@ -516,6 +640,7 @@ class MapAggregator(PyscrollDataAdapter):
         Aggregate animations from all child maps into the aggregator.
         """
         self._update_time()
+        self.invalidate_layer_cache()
         self._tracked_gids = set()
         self._animation_map = {}
         self._animation_queue = []
@@ -530,7 +655,14 @@ class MapAggregator(PyscrollDataAdapter):
                         frames.append(AnimationFrame(image, frame_duration / 1000.0))
                 ani = AnimationToken(set(), frames, self._last_time)
                 self._animation_map[gid] = ani
-                heappush(self._animation_queue, ani)
+                self._animation_queue.append(ani)
+
+        heapify(self._animation_queue)
+
+    def invalidate_layer_cache(self) -> None:
+        self._visible_tile_layers = None
+        for data, _, _ in self.maps:
+            data.invalidate_layer_cache()
 
     def _normalize_positions(self) -> None:
         """Shift maps so that top-left is always (0,0)."""
@@ -566,14 +698,20 @@ class MapAggregator(PyscrollDataAdapter):
     ) -> Iterable[tuple[int, int, int, Surface]]:
         """Yield tile images within the view, with adjusted coords and layers."""
         view = Rect(view)
-        sorted_maps = sorted(self.maps, key=lambda m: m[2])  # sort by z offset
-
-        for data, rect, z in sorted_maps:
+        sorted_maps = self._sorted_maps
+        if sorted_maps is None:
+            # sort by z offset; kept until the map list changes. the rects
+            # are the same objects, so normalizing them in place is seen here
+            sorted_maps = self._sorted_maps = sorted(self.maps, key=lambda m: m[2])
+            self._sorted_rects = [rect for _, rect, _ in sorted_maps]
+
+        # one C call picks the overlapping maps, in z order
+        for i in view.collidelistall(self._sorted_rects):
+            data, rect, z = sorted_maps[i]
             ox, oy = rect.topleft
             clipped = rect.clip(view).move(-ox, -oy)
-            if clipped.width > 0 and clipped.height > 0:
-                for x, y, layer, image in data.get_tile_images_by_rect(clipped):
-                    yield x + ox, y + oy, layer + z, image
+            for x, y, layer, image in data.get_tile_images_by_rect(clipped):
+                yield x + ox, y + oy, layer + z, image
 
     def _get_tile_image(self, x: int, y: int, layer: int) -> Surface | None:
         """Delegate tile image lookup using world_to_local()."""
@@ -647,6 +785,7 @@ class ProceduralData(PyscrollDataAdapter):
         super().__init__()
         self._surfaces: dict[int, Surface] = {}
         self._create_surfaces()
+        self._create_grids()
         self._animated_tile: dict[tuple[int, int, int], Any] = {}
         self._animation_map: dict[int, Any] = {}
         self._animation_queue: list[Any] = []
@@ -678,26 +817,70 @@ class ProceduralData(PyscrollDataAdapter):
         self._surfaces[self._GID_ROCK] = make_surface("#555555")
         self._surfaces[self._GID_ALT_WATER] = make_surface("#62a2cc")
 
+    def _generate_gid(self, x: int, y: int, layer: int) -> int | None:
+        """The procedural rule for the tile at a position on the map."""
+        if layer == 0:
+            return self._GID_GRASS if (x + y) % 2 == 0 else self._GID_WATER
+        elif layer == 1 and x % 5 == 0 and y % 5 == 0:
+            return self._GID_ROCK
+        return None
+
+    def _create_grids(self) -> None:
+        """
+        Generate the whole map once, as [layer][y][x] grids of gids and images.
+
+        The map never changes, so tile lookups become plain list indexing.
+        """
+        surfaces = self._surfaces
+        self._gid_grid: list[list[list[int | None]]] = [
+            [
+                [self._generate_gid(x, y, layer) for x in range(self._MAP_WIDTH)]
+                for y in range(self._MAP_HEIGHT)
+            ]
+            for layer in range(self._LAYER_COUNT)
+        ]
+        self._image_grid: list[list[list[Surface | None]]] = [
+            [[surfaces.get(gid) for gid in row] for row in rows]
+            for rows in self._gid_grid
+        ]
+
     def reload_data(self) -> None:
         """No external data to reload."""
         pass
 
+    def convert_surfaces(self, parent: Surface, alpha: bool = False) -> None:
+        """Convert the tile surfaces to the display format of the parent."""
+        converted = {
+            surf: surf.convert_alpha() if alpha else surf.convert(parent)
+            for surf in self._surfaces.values()
+        }
+        self._surfaces = {gid: converted[surf] for gid, surf in self._surfaces.items()}
+        self._image_grid = [
+            [[converted.get(image, image) for image in row] for row in rows]
+            for rows in self._image_grid
+        ]
+        self._replace_animation_images(converted)
+
     def _get_tile_image_by_id(self, id: int) -> Surface | None:
         return self._surfaces.get(id)
 
     def _get_tile_gid(self, x: int, y: int, layer: int) -> int | None:
-        if not self.is_on_map(x, y):
-            return None
-
-        if layer == 0:
-            return self._GID_GRASS if (x + y) % 2 == 0 else self._GID_WATER
-        elif layer == 1 and x % 5 == 0 and y % 5 == 0:
-            return self._GID_ROCK
+        if (
+            0 <= layer < self._LAYER_COUNT
+            and 0 <= x < self._MAP_WIDTH
+            and 0 <= y < self._MAP_HEIGHT
+        ):
+            return self._gid_grid[layer][y][x]
         return None
 
     def _get_tile_image(self, x: int, y: int, layer: int) -> Surface | None:
-        gid = self._get_tile_gid(x, y, layer)
-        return self._surfaces.get(gid) if gid is not None else None
+        if (
+            0 <= layer < self._LAYER_COUNT
+            and 0 <= x < self._MAP_WIDTH
+            and 0 <= y < self._MAP_HEIGHT
+        ):
+            return self._image_grid[layer][y][x]
+        return None
 
     def get_animations(self) -> list[Any]:
         """
@@ -71,7 +71,9 @@ class PyscrollGroup(LayeredUpdates[Sprite]):
         view_rect = map_layer.view_rect
 
         spritedict = self.spritedict
-        get_layer = self.get_layer_of_sprite
+        # same lookup as get_layer_of_sprite, without the method call
+        get_layer = self._spritelayers.get
+        default_layer = self._default_layer
         sprites = self.sprites  # local binding for speed
 
         renderables: list[Renderable] = []
@@ -86,12 +88,13 @@ class PyscrollGroup(LayeredUpdates[Sprite]):
                 new_rect = rect.move(ox, oy)
                 spritedict[spr] = new_rect
 
+                # positional arguments: layer, rect, surface, blendmode
                 renderables.append(
                     Renderable(
-                        layer=get_layer(spr),
-                        rect=new_rect,
-                        surface=spr.image,
-                        blendmode=getattr(spr, "blendmode", None),
+                        get_layer(spr, default_layer),
+                        new_rect,
+                        spr.image,
+                        getattr(spr, "blendmode", None),
                     )
                 )
             else:
@@ -59,31 +59,29 @@ class FastQuadTree:
         bb = self.boundary.bottom
         cx, cy = self.cx, self.cy
 
-        nw_items: list[Rect] = []
-        ne_items: list[Rect] = []
-        se_items: list[Rect] = []
-        sw_items: list[Rect] = []
+        # Buckets indexed by a 2-bit quadrant code (this level's Morton digit):
+        # bit 0 set = east of cx, bit 1 set = south of cy
+        buckets: tuple[list[Rect], ...] = ([], [], [], [])
+        nw_items, ne_items, sw_items, se_items = buckets
+        straddling = self.items
 
         for rect in rects:
-            rl, rt, rr, rb = rect.left, rect.top, rect.right, rect.bottom
-
             # Rect must fit entirely inside a child to go there
-            in_nw = rr <= cx and rb <= cy
-            in_ne = rl >= cx and rb <= cy
-            in_sw = rr <= cx and rt >= cy
-            in_se = rl >= cx and rt >= cy
-
-            if in_nw:
-                nw_items.append(rect)
-            elif in_ne:
-                ne_items.append(rect)
-            elif in_sw:
-                sw_items.append(rect)
-            elif in_se:
-                se_items.append(rect)
+            if rect.right <= cx:
+                code = 0
+            elif rect.left >= cx:
+                code = 1
             else:
                 # Overlaps split lines → stays in this node
-                self.items.append(rect)
+                straddling.append(rect)
+                continue
+
+            if rect.bottom <= cy:
+                buckets[code].append(rect)
+            elif rect.top >= cy:
+                buckets[code | 2].append(rect)
+            else:
+                straddling.append(rect)
 
         if nw_items:
             self.nw = FastQuadTree(
@@ -129,49 +127,105 @@ class FastQuadTree:
         if not isinstance(rect, Rect):
             rect = get_rect(rect)
 
-        if not self.boundary.colliderect(rect):
-            return set()
-
-        items = self.items
-        hits = {
-            (r.x, r.y, r.w, r.h) for i in rect.collidelistall(items) if (r := items[i])
-        }
-
+        hits: set[tuple[int, int, int, int]] = set()
+        add = hits.add
         rl, rt, rr, rb = rect.left, rect.top, rect.right, rect.bottom
-        cx, cy = self.cx, self.cy
-
-        # Region pruning: decide which children can possibly intersect
-        if rr <= cx:
-            # Entirely on the left side
-            if rb <= cy and self.nw:
-                hits |= self.nw.hit(rect)
-            elif rt >= cy and self.sw:
-                hits |= self.sw.hit(rect)
+        collide = rect.colliderect
+        collide_all = rect.collidelistall
+
+        # Iterative depth-first walk: an explicit stack avoids a Python call
+        # frame and an intermediate set per visited node
+        stack: list[FastQuadTree | None] = [self]
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            node = pop()
+            if node is None or not collide(node.boundary):
+                continue
+
+            items = node.items
+            if items:
+                for i in collide_all(items):
+                    r = items[i]
+                    add((r.x, r.y, r.w, r.h))
+
+            cx, cy = node.cx, node.cy
+
+            # Region pruning: decide which children can possibly intersect
+            if rr <= cx:
+                # Entirely on the left side
+                if rb <= cy and node.nw:
+                    push(node.nw)
+                elif rt >= cy and node.sw:
+                    push(node.sw)
+                else:
+                    push(node.nw)
+                    push(node.sw)
+            elif rl >= cx:
+                # Entirely on the right side
+                if rb <= cy and node.ne:
+                    push(node.ne)
+                elif rt >= cy and node.se:
+                    push(node.se)
+                else:
+                    push(node.ne)
+                    push(node.se)
             else:
-                if self.nw:
-                    hits |= self.nw.hit(rect)
-                if self.sw:
-                    hits |= self.sw.hit(rect)
-        elif rl >= cx:
-            # Entirely on the right side
-            if rb <= cy and self.ne:
-                hits |= self.ne.hit(rect)
-            elif rt >= cy and self.se:
-                hits |= self.se.hit(rect)
-            else:
-                if self.ne:
-                    hits |= self.ne.hit(rect)
-                if self.se:
-                    hits |= self.se.hit(rect)
-        else:
-            # Spans across the vertical split → may touch both sides
-            if self.nw and rt <= cy:
-                hits |= self.nw.hit(rect)
-            if self.sw and rb >= cy:
-                hits |= self.sw.hit(rect)
-            if self.ne and rt <= cy:
-                hits |= self.ne.hit(rect)
-            if self.se and rb >= cy:
-                hits |= self.se.hit(rect)
+                # Spans across the vertical split → may touch both sides
+                if rt <= cy:
+                    push(node.nw)
+                    push(node.ne)
+                if rb >= cy:
+                    push(node.sw)
+                    push(node.se)
 
         return hits
+
+    def hit_batch(
+        self, rects: Sequence[Rect | object]
+    ) -> list[set[tuple[int, int, int, int]]]:
+        """
+        Run hit() for many query rects in a single walk of the tree.
+
+        Each node tests its boundary against all surviving queries with one
+        collidelistall call, so queries that miss a branch are dropped
+        together instead of descending once per query, and each node's rect
+        tuples are built once per batch rather than once per match.
+
+        Returns one set of rect tuples (x, y, w, h) per query, in order.
+        """
+        queries = [r if isinstance(r, Rect) else get_rect(r) for r in rects]
+        results: list[set[tuple[int, int, int, int]]] = [set() for _ in queries]
+
+        stack: list[tuple[FastQuadTree, list[int], list[Rect]]] = [
+            (self, list(range(len(queries))), queries)
+        ]
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            node, indices, candidates = pop()
+            alive = node.boundary.collidelistall(candidates)
+            if not alive:
+                continue
+
+            if len(alive) != len(candidates):
+                indices = [indices[j] for j in alive]
+                candidates = [candidates[j] for j in alive]
+
+            items = node.items
+            if items:
+                # build this node's rect tuples once for the whole batch
+                keys = [(r.x, r.y, r.w, r.h) for r in items]
+                key_at = keys.__getitem__
+                for qi, query in zip(indices, candidates):
+                    matched = query.collidelistall(items)
+                    if matched:
+                        results[qi].update(map(key_at, matched))
+
+            for child in (node.nw, node.ne, node.sw, node.se):
+                if child:
+                    push((child, indices, candidates))
+
+        return results
@@ -24,6 +24,13 @@ def positions():
     return {(1, 2, 0), (3, 4, 1)}
 
 
+def test_animation_frame_is_slotted_and_frozen(surf):
+    frame = AnimationFrame(image=surf, duration=0.5)
+    assert not hasattr(frame, "__dict__")
+    with pytest.raises(AttributeError):
+        frame.duration = 1.0
+
+
 def test_initial_state(frames, positions):
     token = AnimationToken(positions, frames)
     assert token.index == 0
@@ -102,6 +109,41 @@ def test_update_advances(frames, positions):
     assert token.index == 1
 
 
+def test_update_before_next_is_noop(frames, positions):
+    token = AnimationToken(positions, frames)
+    next_time = token.next
+    frame = token.update(current_time=0.25)
+    assert frame is frames[0]
+    assert token.index == 0
+    assert token.next == next_time
+
+
+def test_update_catches_up_after_long_stall(frames, positions):
+    token = AnimationToken(positions, frames)
+    frame = token.update(current_time=1000.25)
+    assert frame is frames[1]
+    assert token.index == 1
+    assert token.next == pytest.approx(1000.5)
+
+
+@pytest.mark.parametrize("current_time", [6.0, 6.05, 6.1, 6.3, 6.55])
+def test_update_cycle_skip_matches_stepping(positions, current_time):
+    def make():
+        frames = [
+            AnimationFrame(image=MagicMock(), duration=d) for d in (0.1, 0.2, 0.3)
+        ]
+        return AnimationToken(positions, frames)
+
+    stepped = make()
+    while current_time >= stepped.next:
+        stepped.advance(stepped.next)
+
+    token = make()
+    token.update(current_time)
+    assert token.index == stepped.index
+    assert token.next == pytest.approx(stepped.next)
+
+
 def test_update_non_looping_stop(frames, positions):
     token = AnimationToken(positions, frames, loop=False)
     token.update(current_time=0.6, elapsed_time=0.1)
@@ -110,6 +152,47 @@ def test_update_non_looping_stop(frames, positions):
     assert token.update(current_time=2.0, elapsed_time=0.5) == frames[-1]
 
 
+@pytest.mark.parametrize("ping_pong", [False, True])
+def test_current_frame_tracks_index(positions, ping_pong):
+    frames = [AnimationFrame(image=MagicMock(), duration=0.1) for _ in range(3)]
+    token = AnimationToken(positions, frames, ping_pong=ping_pong)
+    for step in range(10):
+        frame = token.advance(step * 0.1)
+        assert frame is token.current_frame is frames[token.index]
+    token.reset()
+    assert token.current_frame is frames[0]
+
+
+def test_current_frame_follows_direct_assignment(frames, positions, surf):
+    token = AnimationToken(positions, frames)
+    token.index = 1
+    assert token.current_frame is frames[1]
+
+    swapped = (AnimationFrame(image=surf, duration=0.5),) * 2
+    token.frames = swapped
+    assert token.current_frame is swapped[1]
+    assert token.update(0.0) is swapped[1]
+
+
+def test_replace_images_keeps_timing(positions):
+    old = [MagicMock(), MagicMock(), MagicMock()]
+    new = [MagicMock(), MagicMock()]
+    frames = [
+        AnimationFrame(image=img, duration=0.1 * (i + 1)) for i, img in enumerate(old)
+    ]
+    token = AnimationToken(positions, frames)
+    token.advance(0.0)
+    next_time = token.next
+
+    token.replace_images({old[0]: new[0], old[1]: new[1]})
+
+    assert [f.image for f in token.frames] == [new[0], new[1], old[2]]
+    assert [f.duration for f in token.frames] == [f.duration for f in frames]
+    assert token.index == 1
+    assert token.current_frame.image is new[1]
+    assert token.next == next_time
+
+
 def test_update_no_infinite_loop(positions):
     tiny = AnimationFrame(image=MagicMock(), duration=0.000001)
     token = AnimationToken(positions, [tiny], speed_multiplier=1000.0)
@@ -137,6 +220,24 @@ def test_ping_pong(frames, positions, loop, expect_reverse):
         assert token.done
 
 
+def test_changing_loop_after_construction(frames, positions):
+    token = AnimationToken(positions, frames, loop=True)
+    token.loop = False
+    token.advance(0.5)
+    token.advance(1.5)
+    assert token.done
+    assert token.index == 1
+
+
+def test_changing_ping_pong_after_construction(frames, positions):
+    token = AnimationToken(positions, frames)
+    token.ping_pong = True
+    token.advance(0.5)
+    token.advance(1.5)
+    assert token.index == 0
+    assert token.direction == -1
+
+
 def test_on_complete_called_once(frames, positions):
     cb = MagicMock()
     token = AnimationToken(positions, frames, loop=False, on_complete=cb)
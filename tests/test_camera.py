@@ -17,6 +17,28 @@ from pyscroll.camera import (
 )
 
 
+@pytest.mark.parametrize("lerp_factor", [0.0, 0.1, 0.5, 0.99, 1.0])
+@pytest.mark.parametrize("dt", [0.0, 0.016, 0.5, 2.0])
+def test_smoothing_matches_power_form(lerp_factor, dt):
+    cam = FollowCamera(lerp_factor=lerp_factor)
+    expected = 1.0 - (1.0 - lerp_factor) ** dt
+    assert cam._smoothing(dt) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("lerp_factor", [0.3, 1.0])
+def test_smoothing_holds_still_on_paused_frames(lerp_factor):
+    cam = FollowCamera(lerp_factor=lerp_factor)
+    assert cam._smoothing(0.0) == 0.0
+    assert cam._smoothing(-0.1) == 0.0
+
+
+def test_smoothing_follows_lerp_factor_changes():
+    cam = FollowCamera(lerp_factor=0.5)
+    cam.lerp_factor = 0.75
+    assert cam.lerp_factor == 0.75
+    assert cam._smoothing(1.0) == pytest.approx(0.75)
+
+
 @pytest.mark.parametrize(
     "camera_class",
     [
@@ -49,6 +71,17 @@ def test_follow_camera_deadzone(view_rect, target_rect):
     assert cam.update(view_rect, target_rect, 1.0) == view_rect.center
 
 
+def test_follow_camera_deadzone_not_moved(view_rect, target_rect):
+    dz = Rect(0, 0, 20, 20)
+    cam = FollowCamera(lerp_factor=1.0, deadzone=dz)
+    target_rect.center = view_rect.center
+    assert cam.update(view_rect, target_rect, 1.0) == view_rect.center
+    assert dz == Rect(0, 0, 20, 20)
+
+    target_rect.move_ip(100, 0)
+    assert cam.update(view_rect, target_rect, 1.0) == target_rect.center
+
+
 def test_follow_camera_shake(view_rect, target_rect):
     cam = FollowCamera(lerp_factor=1.0)
     cam.shake(10)
@@ -373,6 +406,28 @@ def test_bounds_camera_own_shake_amount_always_zero(view_rect, target_rect):
     assert cam._shake_amount == 0
 
 
+def test_zoom_camera_frame_rate_independent(view_rect, target_rect):
+    base = FollowCamera(lerp_factor=1.0)
+    coarse = ZoomCamera(base, zoom=1.0, zoom_speed=4.0)
+    fine = ZoomCamera(base, zoom=1.0, zoom_speed=4.0)
+    coarse.set_zoom(2.0)
+    fine.set_zoom(2.0)
+
+    coarse.update(view_rect, target_rect, dt=0.2)
+    for _ in range(10):
+        fine.update(view_rect, target_rect, dt=0.02)
+
+    assert coarse.zoom == pytest.approx(fine.zoom)
+
+
+def test_zoom_camera_settles_on_target(view_rect, target_rect):
+    cam = ZoomCamera(FollowCamera(lerp_factor=1.0), zoom=1.0, zoom_speed=10.0)
+    cam.set_zoom(1.5)
+    for _ in range(100):
+        cam.update(view_rect, target_rect, dt=0.1)
+    assert cam.zoom == 1.5
+
+
 def test_zoom_camera_shake_forwarded_to_base(view_rect, target_rect):
     base = FollowCamera(lerp_factor=1.0)
     cam = ZoomCamera(base, zoom=1.0)
@@ -398,6 +453,14 @@ def test_zoom_camera_shake_visible_in_output(view_rect, target_rect):
     assert (x, y) != target_rect.center
 
 
+def test_debug_camera_diagonal_step(view_rect, target_rect):
+    cam = DebugFlyCamera(speed=100)
+    cam.set_position(0.0, 0.0)
+    cam.set_input(0.5, -1.0)
+    assert cam.update(view_rect, target_rect, 0.5) == (25.0, -50.0)
+    assert cam.move == (0.5, -1.0)
+
+
 def test_debug_camera_set_position(view_rect, target_rect):
     cam = DebugFlyCamera()
     cam.set_position(200.0, 300.0)
@@ -670,3 +733,23 @@ def test_rail_camera_static_closest_point_clamped_end():
     p = (150.0, 0.0)
     result = RailCamera._closest_point_on_segment(a, b, p)
     assert result == pytest.approx((100.0, 0.0), abs=1e-6)
+
+
+def test_cutscene_reassigning_waypoints_rebuilds_path(view_rect, target_rect):
+    cam = CutsceneCamera([(0, 0), (100, 100)], duration=1.0)
+    cam.waypoints = [(0, 0), (200, 0)]
+    pos = cam.update(view_rect, target_rect, 0.5)
+    assert pos == pytest.approx((100.0, 0.0))
+
+
+def test_cutscene_editing_waypoints_in_place_rebuilds_path(view_rect, target_rect):
+    cam = CutsceneCamera([(0, 0), (100, 100)], duration=1.0)
+    assert cam.update(view_rect, target_rect, 0.5) == pytest.approx((50.0, 50.0))
+
+    cam.waypoints[1].x = 300
+    cam.reset()
+    assert cam.update(view_rect, target_rect, 0.5) == pytest.approx((150.0, 50.0))
+
+    cam.waypoints.append((300, 300))
+    cam.reset()
+    assert cam.update(view_rect, target_rect, 0.75) == pytest.approx((300.0, 200.0))
@@ -209,3 +209,13 @@ def test_is_transitioning_false_after_instant_switch(view_rect, target_rect):
     manager = CameraManager(cam_a)
     manager.set_camera(cam_b, duration=0)
     assert not manager.is_transitioning
+
+
+def test_transition_lands_exactly_on_new_camera(view_rect, target_rect):
+    cam_a = DummyCamera((0.0, 0.0))
+    cam_b = DummyCamera((0.1, 0.7))
+    manager = CameraManager(cam_a)
+    manager.set_camera(cam_b, duration=0.3)
+    pos = manager.update(view_rect, target_rect, 0.5)
+    assert pos == (0.1, 0.7)
+    assert manager.current is cam_b
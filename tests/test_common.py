@@ -0,0 +1,55 @@
+import pytest
+from pygame.rect import Rect
+from pygame.surface import Surface
+
+from pyscroll.common import rect_difference, rect_to_bb, surface_clipping_context
+
+
+def test_rect_difference_disjoint_returns_a():
+    a = Rect(0, 0, 10, 10)
+    assert rect_difference(a, Rect(20, 20, 5, 5)) == [a]
+
+
+def test_rect_difference_contained_returns_nothing():
+    assert rect_difference(Rect(2, 2, 4, 4), Rect(0, 0, 10, 10)) == []
+
+
+def test_rect_difference_hole_in_middle():
+    parts = rect_difference(Rect(0, 0, 10, 10), Rect(3, 3, 4, 4))
+    assert parts == [
+        Rect(0, 0, 10, 3),
+        Rect(0, 7, 10, 3),
+        Rect(0, 3, 3, 4),
+        Rect(7, 3, 3, 4),
+    ]
+    assert sum(r.w * r.h for r in parts) == 100 - 16
+
+
+@pytest.mark.parametrize(
+    "b, expected",
+    [
+        pytest.param((5, 0, 10, 10), [Rect(0, 0, 5, 10)], id="right_half"),
+        pytest.param((0, 5, 10, 10), [Rect(0, 0, 10, 5)], id="bottom_half"),
+    ],
+)
+def test_rect_difference_accepts_tuples(b, expected):
+    assert rect_difference((0, 0, 10, 10), b) == expected
+
+
+@pytest.mark.parametrize(
+    "rect", [Rect(2, 3, 4, 5), (2, 3, 4, 5)], ids=["rect", "tuple"]
+)
+def test_rect_to_bb(rect):
+    assert rect_to_bb(rect) == (2, 3, 5, 7)
+
+
+def test_surface_clipping_context_restores_clip_on_error():
+    surface = Surface((100, 100))
+    surface.set_clip(Rect(1, 1, 50, 50))
+    with (
+        pytest.raises(RuntimeError),
+        surface_clipping_context(surface, Rect(10, 10, 5, 5)),
+    ):
+        assert surface.get_clip() == Rect(10, 10, 5, 5)
+        raise RuntimeError
+    assert surface.get_clip() == Rect(1, 1, 50, 50)
@@ -1,6 +1,11 @@
 import pytest
 
-from pyscroll.common import vector2_to_iso, vector3_to_iso
+from pyscroll.common import (
+    vector2_to_iso,
+    vector2_to_iso_batch,
+    vector3_to_iso,
+    vector3_to_iso_batch,
+)
 
 
 @pytest.fixture
@@ -115,3 +120,16 @@ def test_vector3_invalid_inputs(bad_input):
 def test_vector2_invalid_inputs(bad_input):
     with pytest.raises(ValueError):
         vector2_to_iso(bad_input)
+
+
+def test_vector3_batch_matches_scalar(offset_fixture):
+    vectors = [(1, 1, 0), (2, 1, 0), (-1, -2, 0), (3, 5, 2), (10**6, 0, 10**6)]
+    expected = [vector3_to_iso(v, offset_fixture) for v in vectors]
+    assert vector3_to_iso_batch(vectors, offset_fixture) == expected
+
+
+def test_vector2_batch_matches_scalar(offset_fixture):
+    vectors = [(1, 1), (2, 1), (-1, -2), (3, 5), (10**6, 0)]
+    expected = [vector2_to_iso(v, offset_fixture) for v in vectors]
+    assert vector2_to_iso_batch(vectors, offset_fixture) == expected
+    assert vector2_to_iso_batch([]) == []
@@ -57,6 +57,31 @@ def test_visible_tile_layers_with_offsets(aggregator, mock_data1, mock_data2):
     assert aggregator.visible_tile_layers == [0, 11]
 
 
+def test_visible_tile_layers_follow_add_and_remove(aggregator, mock_data1, mock_data2):
+    aggregator.add_map(mock_data1, (0, 0), layer=0)
+    assert aggregator.visible_tile_layers == [0]
+    assert aggregator.visible_tile_layers is aggregator.visible_tile_layers
+
+    aggregator.add_map(mock_data2, (0, 0), layer=10)
+    assert aggregator.visible_tile_layers == [0, 11]
+
+    aggregator.remove_map(mock_data1)
+    assert aggregator.visible_tile_layers == [11]
+
+
+def test_invalidate_layer_cache_reaches_children(aggregator, mock_data1, mock_data2):
+    aggregator.add_map(mock_data1, (0, 0), layer=0)
+    aggregator.add_map(mock_data2, (0, 0), layer=10)
+    assert aggregator.visible_tile_layers == [0, 11]
+
+    mock_data2.visible_tile_layers = []
+    aggregator.invalidate_layer_cache()
+
+    assert aggregator.visible_tile_layers == [0]
+    mock_data1.invalidate_layer_cache.assert_called_once()
+    mock_data2.invalidate_layer_cache.assert_called_once()
+
+
 def test_get_tile_images_by_rect_layer_adjustment(aggregator, mock_data1, mock_data2):
     aggregator.add_map(mock_data1, (0, 0), layer=0)
     aggregator.add_map(mock_data2, (5, 0), layer=10)
@@ -185,6 +210,22 @@ def test_get_tile_images_sorted_by_z(aggregator, mock_data1, mock_data2):
     assert all(l < 10 for l in layers[:first_high_z])
 
 
+def test_get_tile_images_order_follows_added_and_removed_maps(
+    aggregator, mock_data1, mock_data2
+):
+    aggregator.add_map(mock_data1, (0, 0), layer=5)
+    list(aggregator.get_tile_images_by_rect(Rect(0, 0, 5, 5)))
+
+    aggregator.add_map(mock_data2, (0, 0), layer=0)
+    tiles = list(aggregator.get_tile_images_by_rect(Rect(0, 0, 5, 5)))
+    assert tiles[0][2] == 1
+    assert tiles[-1][2] == 5
+
+    aggregator.remove_map(mock_data2)
+    tiles = list(aggregator.get_tile_images_by_rect(Rect(0, 0, 5, 5)))
+    assert {layer for _, _, layer, _ in tiles} == {5}
+
+
 def test_reload_data_delegates_to_all_maps(aggregator, mock_data1, mock_data2):
     aggregator.add_map(mock_data1, (0, 0))
     aggregator.add_map(mock_data2, (5, 0))
@@ -231,6 +272,39 @@ def test_overlapping_maps_z_priority(aggregator, mock_data1, mock_data2):
     assert layers[-1] >= 10
 
 
+def test_world_to_local_falls_through_to_lower_map(aggregator, mock_data1, mock_data2):
+    aggregator.add_map(mock_data1, (0, 0), layer=0)
+    aggregator.add_map(mock_data2, (2, 2), layer=0)
+
+    # mock_data2 is on top but only has layer 1
+    assert aggregator.world_to_local(3, 3, 1) == (mock_data2, 1, 1, 1)
+    assert aggregator.world_to_local(3, 3, 0) == (mock_data1, 3, 3, 0)
+    assert aggregator.world_to_local(6, 6, 0) is None
+
+
+def test_world_to_local_follows_map_changes(aggregator, mock_data1, mock_data2):
+    aggregator.add_map(mock_data1, (0, 0))
+    assert aggregator.world_to_local(1, 1, 0) == (mock_data1, 1, 1, 0)
+
+    # normalization shifts mock_data1 right by two tiles
+    aggregator.add_map(mock_data2, (-2, 0))
+    assert aggregator.world_to_local(1, 1, 0) is None
+    assert aggregator.world_to_local(3, 1, 0) == (mock_data1, 1, 1, 0)
+
+    aggregator.remove_map(mock_data1)
+    assert aggregator.world_to_local(3, 1, 0) is None
+
+
+def test_world_to_local_memo_is_bounded(aggregator, mock_data1, monkeypatch):
+    monkeypatch.setattr(MapAggregator, "_OWNERS_LIMIT", 4)
+    aggregator.add_map(mock_data1, (0, 0))
+
+    for x in range(5):
+        for y in range(5):
+            assert aggregator.world_to_local(x, y, 0) == (mock_data1, x, y, 0)
+            assert len(aggregator._owners) <= 4
+
+
 def test_world_to_local_multiple_maps(aggregator, mock_data1, mock_data2):
     mock_data1.visible_tile_layers = [0]
     mock_data2.visible_tile_layers = [0]
@@ -284,3 +358,39 @@ def test_reload_animations_aggregates_all_children(aggregator, mock_data1, mock_
 
     assert set(aggregator._tracked_gids) == {1, 2}
     assert len(aggregator._animation_queue) == 2
+
+
+def test_reload_animations_builds_a_heap(aggregator, mock_data1, mock_data2):
+    mock_data1.get_animations.return_value = [(1, [(0, 400)]), (2, [(0, 100)])]
+    mock_data2.get_animations.return_value = [(3, [(0, 300)]), (4, [(0, 50)])]
+    mock_data1._get_tile_image_by_id.return_value = Surface((16, 16))
+    mock_data2._get_tile_image_by_id.return_value = Surface((16, 16))
+
+    aggregator.add_map(mock_data1, (0, 0))
+    aggregator.add_map(mock_data2, (0, 0))
+    aggregator.reload_animations()
+
+    queue = aggregator._animation_queue
+    assert queue[0] is aggregator._animation_map[4]
+    for i in range(1, len(queue)):
+        assert queue[(i - 1) // 2].next <= queue[i].next
+
+
+def test_get_tile_images_by_rect_queries_only_overlapping_maps(aggregator):
+    children = []
+    for i, z in enumerate((3, 0, 1)):
+        child = MagicMock(spec=PyscrollDataAdapter)
+        child.tile_size = (16, 16)
+        child.map_size = (5, 5)
+        child.visible_tile_layers = [0]
+        child.get_tile_images_by_rect.return_value = [(0, 0, 0, Surface((16, 16)))]
+        aggregator.add_map(child, (i * 5, 0), layer=z)
+        children.append(child)
+
+    # touches the right edge of the first map without overlapping it
+    tiles = list(aggregator.get_tile_images_by_rect(Rect(5, 1, 7, 2)))
+
+    children[0].get_tile_images_by_rect.assert_not_called()
+    children[1].get_tile_images_by_rect.assert_called_once_with(Rect(0, 1, 5, 2))
+    children[2].get_tile_images_by_rect.assert_called_once_with(Rect(0, 1, 2, 2))
+    assert [(x, layer) for x, _, layer, _ in tiles] == [(5, 0), (10, 1)]
@@ -45,6 +45,17 @@ def test_get_tile_gid_overlay(proc):
     assert proc._get_tile_gid(0, 0, 2) is None
 
 
+def test_tile_grids_match_procedural_rule(proc):
+    for layer in range(-1, 5):
+        for y in range(-2, 33):
+            for x in range(-2, 43):
+                on_map = 0 <= x < 40 and 0 <= y < 30
+                gid = proc._generate_gid(x, y, layer) if on_map else None
+                assert proc._get_tile_gid(x, y, layer) == gid
+                image = proc._get_tile_image(x, y, layer)
+                assert image is (proc._surfaces[gid] if gid else None)
+
+
 def test_get_tile_image(proc):
     img = proc._get_tile_image(0, 0, 0)
     assert isinstance(img, Surface)
@@ -177,3 +188,34 @@ def test_process_animation_queue_stress(proc):
 
         # Position must remain tracked
         assert (1, 0, 0) in token.positions
+
+
+def test_process_animation_queue_redraws_whole_column(proc):
+    proc.reload_animations()
+    # (5, 0) is WATER on the ground layer with a ROCK on the detail layer
+    proc.get_tile_image(5, 0, 0)
+    token = proc._animation_map[proc._GID_WATER]
+    token.next = 0
+
+    updates = proc.process_animation_queue(pygame.Rect(0, 0, 40, 30))
+
+    assert [(x, y, layer) for x, y, layer, _ in updates] == [(5, 0, 0), (5, 0, 1)]
+    assert updates[0][3] is token.current_frame.image
+    assert updates[1][3] is proc._surfaces[proc._GID_ROCK]
+
+
+def test_convert_surfaces_replaces_tiles_and_frames(proc):
+    proc.reload_animations()
+    proc.get_tile_image(1, 0, 0)  # (1,0) is WATER, now animated
+    original = dict(proc._surfaces)
+
+    proc.convert_surfaces(pygame.display.get_surface(), alpha=True)
+
+    assert all(proc._surfaces[gid] is not surf for gid, surf in original.items())
+    assert proc._get_tile_image(0, 0, 0) is proc._surfaces[proc._GID_GRASS]
+    token = proc._animation_map[proc._GID_WATER]
+    assert [f.image for f in token.frames] == [
+        proc._surfaces[proc._GID_WATER],
+        proc._surfaces[proc._GID_ALT_WATER],
+    ]
+    assert proc.get_tile_image(1, 0, 0) is proc._surfaces[proc._GID_WATER]
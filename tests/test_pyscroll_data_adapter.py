@@ -5,6 +5,7 @@ import pytest
 from pygame.rect import Rect
 from pygame.surface import Surface
 
+from pyscroll.animation import AnimationFrame, AnimationToken
 from pyscroll.data import PyscrollDataAdapter
 
 
@@ -138,6 +139,23 @@ def test_get_tile_image_animated_tile(adapter):
     assert adapter.get_tile_image(1, 2, 0) is surf
 
 
+def test_get_tile_image_without_animations_skips_gid_lookup(adapter):
+    surf = Surface((32, 32))
+    adapter._get_tile_image = lambda x, y, l: surf
+    # _get_tile_gid raises on this adapter, so it must not be reached
+    assert adapter.get_tile_image(3, 4, 0) is surf
+    assert adapter._animated_tile == {}
+
+
+def test_get_tile_image_unanimated_gid_is_not_cached(adapter):
+    surf = Surface((32, 32))
+    adapter._animation_map = {5: MagicMock()}
+    adapter._get_tile_gid = lambda x, y, l: 6
+    adapter._get_tile_image = lambda x, y, l: surf
+    assert adapter.get_tile_image(3, 4, 0) is surf
+    assert adapter._animated_tile == {}
+
+
 def test_get_tile_image_animation_map_initial_frame(adapter):
     surf = Surface((32, 32))
     token = MagicMock()
@@ -176,6 +194,65 @@ def test_process_animation_queue_updates_tiles(adapter):
     assert updates == [(1, 1, 0, surf2)]
 
 
+def test_process_animation_queue_keeps_heap_order(adapter):
+    surf = Surface((32, 32))
+    tokens = [
+        AnimationToken({(i, 0, 0)}, [AnimationFrame(surf, d), AnimationFrame(surf, d)])
+        for i, d in enumerate((3.0, 1.0, 2.0, 0.5))
+    ]
+    adapter._animation_queue = sorted(tokens)
+    adapter.pause_animations()
+    adapter._last_time = 10.0
+
+    adapter.process_animation_queue(Rect(0, 0, 10, 10))
+
+    queue = adapter._animation_queue
+    assert all(token.next > 10.0 for token in queue)
+    for i in range(1, len(queue)):
+        assert queue[(i - 1) // 2].next <= queue[i].next
+
+
+def test_process_animation_queue_prunes_positions_outside_view(adapter):
+    surf = Surface((32, 32))
+    inside = {(2, 2, 0), (5, 3, 0), (2, 7, 0)}
+    outside = {(1, 2, 0), (6, 2, 0), (2, 1, 0), (2, 8, 0)}
+    token = AnimationToken(inside | outside, [AnimationFrame(surf, 1.0)] * 2)
+    adapter._animation_queue = [token]
+    adapter._animated_tile = dict.fromkeys(inside | outside, surf)
+    adapter.pause_animations()
+    adapter._last_time = 5.0
+
+    updates = adapter.process_animation_queue(Rect(2, 2, 4, 6))
+
+    assert {(x, y, layer) for x, y, layer, _ in updates} == inside
+    assert token.positions == inside
+    assert adapter._animated_tile.keys() == inside
+
+
+def test_process_animation_queue_follows_moving_view(adapter):
+    surf = Surface((32, 32))
+    token = AnimationToken(set(), [AnimationFrame(surf, 1.0)] * 2)
+    adapter._animation_map = {7: token}
+    adapter._animation_queue = [token]
+    adapter._get_tile_gid = lambda x, y, l: 7
+    adapter._get_tile_image = lambda x, y, l: surf
+    adapter.get_tile_image(0, 0, 0)
+    adapter.get_tile_image(8, 0, 0)
+    adapter.pause_animations()
+
+    adapter._last_time = 5.0
+    updates = adapter.process_animation_queue(Rect(0, 0, 4, 4))
+    assert [(x, y) for x, y, _, _ in updates] == [(0, 0)]
+    assert token.positions == {(0, 0, 0)}
+
+    # scrolling draws the newly exposed tile, which registers it again
+    adapter.get_tile_image(8, 0, 0)
+    adapter._last_time = 10.0
+    updates = adapter.process_animation_queue(Rect(6, 0, 4, 4))
+    assert [(x, y) for x, y, _, _ in updates] == [(8, 0)]
+    assert token.positions == {(8, 0, 0)}
+
+
 def test_get_tile_images_by_rect_iteration_order(adapter):
     calls = []
     adapter._get_tile_image = lambda x, y, l: calls.append((x, y)) or None
@@ -186,6 +263,39 @@ def test_get_tile_images_by_rect_iteration_order(adapter):
     assert calls == [(0, 0)]
 
 
+def test_get_tile_images_by_rect_matches_get_tile_image(adapter):
+    plain = Surface((32, 32))
+    animated = Surface((32, 32))
+    token = AnimationToken(set(), [AnimationFrame(animated, 1.0)])
+    adapter._animation_map = {7: token}
+    adapter._get_tile_gid = lambda x, y, l: 7 if x == 1 else 1
+    adapter._get_tile_image = lambda x, y, l: plain if y else None
+
+    tiles = list(adapter.get_tile_images_by_rect(Rect(0, 0, 2, 2)))
+
+    assert tiles == [
+        (0, 1, 0, plain),
+        (1, 0, 0, animated),
+        (1, 1, 0, animated),
+    ]
+    assert token.positions == {(1, 0, 0), (1, 1, 0)}
+    for x, y, layer, tile in tiles:
+        assert adapter.get_tile_image(x, y, layer) is tile
+
+
+def test_get_tile_images_by_rect_uses_get_tile_image_override():
+    override = Surface((32, 32))
+
+    class OverrideAdapter(MinimalDummyAdapter):
+        def get_tile_image(self, x, y, layer):
+            return override if x == y else None
+
+    adapter = OverrideAdapter()
+    tiles = list(adapter.get_tile_images_by_rect(Rect(0, 0, 2, 2)))
+
+    assert tiles == [(0, 0, 0, override), (1, 1, 0, override)]
+
+
 def test_update_time_does_not_advance_when_paused(adapter):
     adapter.pause_animations()
     before = adapter._last_time
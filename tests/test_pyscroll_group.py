@@ -129,6 +129,30 @@ def test_sprite_layer(group, map_layer, surface, sprite):
     assert group.get_layer_of_sprite(sprite) == 3
 
 
+def test_draw_passes_layer_and_blendmode_to_renderer(group, map_layer, surface):
+    sprites = []
+    for layer, blendmode in ((2, None), (5, pygame.BLEND_ADD)):
+        spr = Sprite()
+        spr.image = Surface((8, 8))
+        spr.rect = Rect(10 * layer, 10, 8, 8)
+        if blendmode is not None:
+            spr.blendmode = blendmode
+        group.add(spr, layer=layer)
+        sprites.append(spr)
+
+    map_layer.get_center_offset.return_value = (3, 4)
+    map_layer.view_rect = Rect(0, 0, 640, 480)
+    group.draw(surface)
+
+    renderables = map_layer.draw.call_args.args[2]
+    assert [(r.layer, r.blendmode) for r in renderables] == [
+        (2, None),
+        (5, pygame.BLEND_ADD),
+    ]
+    assert [r.surface for r in renderables] == [spr.image for spr in sprites]
+    assert renderables[0].rect == Rect(23, 14, 8, 8)
+
+
 def test_lostsprites_reset(group, map_layer, surface, sprite):
     group.add(sprite)
 
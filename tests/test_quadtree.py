@@ -156,3 +156,38 @@ def test_hit_tuple_format():
     qt = FastQuadTree([Rect(0, 0, 10, 10)])
     hits = qt.hit(Rect(0, 0, 10, 10))
     assert hits == {(0, 0, 10, 10)}
+
+
+def test_rects_land_in_expected_quadrant():
+    nw, ne = Rect(0, 0, 10, 10), Rect(50, 0, 10, 10)
+    sw, se = Rect(0, 50, 10, 10), Rect(50, 50, 10, 10)
+    straddler = Rect(20, 20, 20, 20)
+    fillers = [Rect(i, i, 1, 1) for i in range(8)]
+    qt = FastQuadTree([nw, ne, sw, se, straddler, *fillers], depth=1)
+    assert straddler in qt.items
+    assert ne in list(qt.ne)
+    assert sw in list(qt.sw)
+    assert se in list(qt.se)
+    assert nw in list(qt.nw)
+
+
+def test_hit_batch_matches_hit():
+    rects = [Rect(x * 12, y * 12, 10, 10) for x in range(20) for y in range(20)]
+    qt = FastQuadTree(rects, depth=3)
+    queries = [
+        Rect(0, 0, 30, 30),
+        Rect(100, 100, 50, 50),
+        Rect(1000, 1000, 10, 10),  # outside the tree
+        Rect(115, 0, 2, 240),  # straddles the vertical split
+    ]
+    assert qt.hit_batch(queries) == [qt.hit(q) for q in queries]
+
+
+def test_hit_batch_empty_and_non_rect():
+    class Dummy:
+        def __init__(self, rect):
+            self.rect = rect
+
+    qt = FastQuadTree([Rect(0, 0, 10, 10)])
+    assert qt.hit_batch([]) == []
+    assert qt.hit_batch([Dummy(Rect(5, 5, 2, 2))]) == [{(0, 0, 10, 10)}]
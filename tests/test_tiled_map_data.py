@@ -49,6 +49,32 @@ def test_visible_tile_layers(tiled_map_data):
     assert tiled_map_data.visible_tile_layers == [0]
 
 
+def test_visible_tile_layers_refresh_on_reload(tiled_map_data, mock_tmx):
+    assert tiled_map_data.visible_tile_layers is tiled_map_data.visible_tile_layers
+
+    mock_tmx.visible_tile_layers = iter([0, 1])
+    assert tiled_map_data.visible_tile_layers == [0]
+
+    tiled_map_data.reload_animations()
+    assert tiled_map_data.visible_tile_layers == [0, 1]
+
+
+def test_invalidate_layer_cache_picks_up_visibility(tiled_map_data, mock_tmx):
+    assert tiled_map_data.visible_tile_layers == [0]
+    mock_tmx.visible_tile_layers = iter([])
+    tiled_map_data.invalidate_layer_cache()
+    assert tiled_map_data.visible_tile_layers == []
+
+
+def test_get_tile_images_by_rect_uses_cached_layers(tiled_map_data, mock_tmx):
+    assert tiled_map_data.visible_tile_layers == [0]
+    mock_tmx.visible_tile_layers = iter([])
+
+    tiles = list(tiled_map_data.get_tile_images_by_rect((0, 0, 2, 2)))
+
+    assert len(tiles) == 4
+
+
 def test_get_tile_image(tiled_map_data):
     image = tiled_map_data.get_tile_image(0, 0, 0)
     assert isinstance(image, Surface)
@@ -132,6 +158,43 @@ def test_get_tile_images_by_rect_coordinates(tiled_map_data):
     assert ys == {0, 1}
 
 
+def test_get_tile_images_by_rect_skips_empty_gids(mock_tmx):
+    mock_tmx.layers[0].data = [[0, 1, 0, 0, 1], [0, 0, 0, 0, 0], [1, 0, 0, 1, 0]]
+    data = TiledMapData(mock_tmx)
+
+    tiles = list(data.get_tile_images_by_rect((-1, 0, 5, 3)))
+
+    assert [(x, y) for x, y, _, _ in tiles] == [(1, 0), (0, 2), (3, 2)]
+
+
+def test_convert_surfaces_updates_animation_frames(mock_tmx):
+    data = TiledMapData(mock_tmx)
+    data.get_tile_image(0, 0, 0)
+
+    data.convert_surfaces(Surface((16, 16)), alpha=True)
+
+    token = data._animation_map[1]
+    assert [f.image for f in token.frames] == data.tmx.images
+    assert data._animated_tile[(0, 0, 0)] is data.tmx.images[0]
+
+
+def test_get_tile_images_by_rect_uses_animated_frames(mock_tmx):
+    mock_tmx.layers[0].data = [[1, 2, 1], [2, 2, 2]]
+    mock_tmx.images = [Surface((16, 16)) for _ in range(3)]
+    data = TiledMapData(mock_tmx)
+    frame = Surface((16, 16))
+    data._animated_tile[(2, 0, 0)] = frame
+
+    tiles = {
+        (x, y): tile for x, y, _, tile in data.get_tile_images_by_rect((0, 0, 3, 2))
+    }
+
+    assert tiles[(2, 0)] is frame
+    assert tiles[(0, 0)] is mock_tmx.images[1]
+    assert tiles[(1, 0)] is mock_tmx.images[2]
+    assert data._animation_map[1].positions == {(0, 0, 0), (2, 0, 0)}
+
+
 def test_convert_surfaces_modifies_images(mock_tmx):
     data = TiledMapData(mock_tmx)
     parent = Surface((16, 16))